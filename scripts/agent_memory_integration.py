@@ -4,24 +4,114 @@ LCT Commit Agent Memory Integration
 Provides memory management capabilities for all agents
 """
 
+import copy
+import heapq
+import itertools
 import json
 import os
+import re
 import sys
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Set, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Memory files are read by code, so they are written compact unless a human
+# asks for indented output with LCT_MEMORY_PRETTY=1
+PRETTY_MEMORY_FILES = os.environ.get("LCT_MEMORY_PRETTY") == "1"
+
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Any, pretty: bool = PRETTY_MEMORY_FILES) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any, pretty: bool = PRETTY_MEMORY_FILES) -> bytes:
+        if pretty:
+            return json.dumps(data, indent=2).encode()
+        return json.dumps(data, separators=(',', ':')).encode()
+
+# Per-process sequence keeps memory IDs created within the same second unique;
+# the process id in the ID keeps them apart from other processes' sequences
+_memory_seq = itertools.count()
+
+# Topic keywords that map a free-text query onto memory tags
+_TAG_RE = re.compile(r"invoice|validation|security|teaching", re.IGNORECASE)
+
+@lru_cache(maxsize=4096)
+def _load_memory_cached(path_str: str, mtime_ns: int, size: int) -> Dict:
+    """Parse a memory file once per (mtime, size) - a rewrite changes the key"""
+    with open(path_str, 'rb') as f:
+        return _json_loads(f.read())
+
+def _stat_key(memory_file: str) -> tuple:
+    """(mtime_ns, size) of a file - changes whenever the file is rewritten"""
+    st = os.stat(memory_file)
+    return st.st_mtime_ns, st.st_size
+
+def _read_memory(memory_file: str) -> Dict:
+    """Return the cached parse of a memory file (shared - do not mutate)"""
+    return _load_memory_cached(memory_file, *_stat_key(memory_file))
+
 class LCTMemorySystem:
     """Centralized memory system for LCT Commit agents"""
     
+    _shared: Optional["LCTMemorySystem"] = None
+    _shared_lock = threading.Lock()
+    
+    @classmethod
+    def get_shared(cls) -> "LCTMemorySystem":
+        """Return the process-wide instance so agents share schema and indexes"""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
     def __init__(self):
         self.project_root = project_root
         self.memory_dir = self.project_root / "memory"
         self.schema_file = self.memory_dir / "schema.json"
+        self.access_log = self.memory_dir / "access_counts.log"
+        self.access_lock = self.memory_dir / "access_counts.lock"
+        
+        # Hot paths work on plain strings rather than building Path objects
+        self._memory_dir_path = str(self.memory_dir)
+        self._cat_paths: Dict[str, str] = {}
+        
+        # Directory index, rescanned only when a directory's mtime changes
+        self._index: Dict[str, str] = {}
+        self._cat_index: Dict[str, List[str]] = {}
+        self._dir_mtimes: Dict[str, int] = {}
+        self._categories: List[str] = []
+        self._root_mtime: Optional[int] = None
+        
+        # Inverted indexes so filtered queries only load matching files
+        self._agent_idx: Dict[str, Set[str]] = defaultdict(set)
+        self._type_idx: Dict[str, Set[str]] = defaultdict(set)
+        self._tag_idx: Dict[str, Set[str]] = defaultdict(set)
+        self._file_keys: Dict[str, tuple] = {}
         
         # Load schema
         self.schema = self._load_schema()
@@ -29,23 +119,62 @@ class LCTMemorySystem:
     def _load_schema(self) -> Dict:
         """Load the memory schema"""
         if self.schema_file.exists():
-            with open(self.schema_file) as f:
-                return json.load(f)
+            return _read_memory(str(self.schema_file))
         return {}
     
     def add_memory(self, category: str, memory_type: str, content: Dict, 
                    metadata: Optional[Dict] = None, agent: str = "system") -> str:
         """Add a new memory to the system"""
-        memory_id = f"{category}_{memory_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        memory_data = self._build_memory(category, memory_type, content, metadata,
+                                         agent, datetime.now())
+        
+        # Save to file system
+        self._save_memory_file(memory_data)
+        
+        return memory_data["memory_id"]
+    
+    def bulk_store(self, entries: List[tuple]) -> List[str]:
+        """Add several memories at once
+        
+        Each entry is (category, memory_type, content, metadata, agent). The
+        batch shares one timestamp, files are written grouped by category and
+        each category's directory index is updated once. Returns the memory
+        IDs in entry order.
+        """
+        now = datetime.now()
+        batch = [self._build_memory(category, memory_type, content, metadata, agent, now)
+                 for category, memory_type, content, metadata, agent in entries]
+        
+        new_files: Dict[str, List[str]] = defaultdict(list)
+        mtimes_before: Dict[str, Optional[int]] = {}
+        for memory_data in sorted(batch, key=lambda m: m["category"]):
+            category = memory_data["category"]
+            if category not in mtimes_before:
+                mtimes_before[category] = self._dir_mtime(category)
+            filepath, is_new = self._write_memory_file(memory_data)
+            if is_new:
+                new_files[category].append(filepath)
         
-        memory_data = {
+        for category, mtime_before in mtimes_before.items():
+            self._add_to_dir_index(category, new_files[category], mtime_before)
+        
+        return [memory_data["memory_id"] for memory_data in batch]
+    
+    def _build_memory(self, category: str, memory_type: str, content: Dict,
+                      metadata: Optional[Dict], agent: str, now: datetime) -> Dict:
+        """Assemble a memory record stamped with the given time"""
+        now_iso = now.isoformat()
+        memory_id = f"{category}_{memory_type}_{now.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{next(_memory_seq):04d}"
+        
+        return {
             "memory_id": memory_id,
             "category": category,
             "type": memory_type,
             "content": {
                 **content,
-                "created_at": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
+                "created_at": now_iso,
+                "created_at_epoch": now.timestamp(),
+                "last_updated": now_iso,
                 "access_count": 0
             },
             "metadata": {
@@ -55,11 +184,6 @@ class LCTMemorySystem:
                 **(metadata or {})
             }
         }
-        
-        # Save to file system
-        self._save_memory_file(memory_data)
-        
-        return memory_id
     
     def get_memories(self, category: Optional[str] = None, 
                     memory_type: Optional[str] = None,
@@ -69,35 +193,53 @@ class LCTMemorySystem:
         """Retrieve memories based on criteria"""
         memories = []
         
-        # Determine search directories
-        search_dirs = []
+        # Determine search categories
         if category:
-            search_dirs.append(self.memory_dir / category)
+            self._refresh_index(category)
+            search_categories = [category]
         else:
-            for cat_dir in self.memory_dir.iterdir():
-                if cat_dir.is_dir() and cat_dir.name != "agents":
-                    search_dirs.append(cat_dir)
+            self._refresh_index_all()
+            search_categories = self._categories
         
-        # Search through directories
-        for search_dir in search_dirs:
-            if not search_dir.exists():
-                continue
+        # Narrow to candidate files before loading anything
+        tag_set = frozenset(tags) if tags else None
+        candidates = self._candidate_files(memory_type, tag_set, agent)
+        
+        # Search through indexed files
+        for search_category in search_categories:
+            for memory_file in self._cat_index.get(search_category, []):
+                if candidates is not None and memory_file not in candidates:
+                    continue
                 
-            for memory_file in search_dir.glob("*.json"):
-                with open(memory_file) as f:
-                    memory = json.load(f)
+                memory = _read_memory(memory_file)
                 
                 # Apply filters
-                if self._matches_criteria(memory, category, memory_type, tags, agent):
+                if self._matches_criteria(memory, category, memory_type, tag_set, agent):
                     memories.append(memory)
         
-        # Sort by creation date (newest first)
-        memories.sort(key=lambda x: x["content"]["created_at"], reverse=True)
+        # Newest first - only the top `limit` entries are ever ordered
+        newest = heapq.nlargest(limit, memories, key=lambda x: x["content"]["created_at"])
+        
+        # Hand callers their own copies so the parse cache stays pristine
+        return [copy.deepcopy(memory) for memory in newest]
+    
+    def _candidate_files(self, memory_type: Optional[str], tags: Optional[FrozenSet[str]],
+                         agent: Optional[str]) -> Optional[Set[str]]:
+        """Intersect the inverted indexes; None means no filter applies"""
+        matches = []
+        if agent:
+            matches.append(self._agent_idx.get(agent, set()))
+        if memory_type:
+            matches.append(self._type_idx.get(memory_type, set()))
+        if tags:
+            matches.append(set().union(*(self._tag_idx.get(tag, set()) for tag in tags)))
         
-        return memories[:limit]
+        if not matches:
+            return None
+        return set.intersection(*matches)
     
     def _matches_criteria(self, memory: Dict, category: Optional[str],
-                         memory_type: Optional[str], tags: Optional[List[str]],
+                         memory_type: Optional[str], tags: Optional[FrozenSet[str]],
                          agent: Optional[str]) -> bool:
         """Check if memory matches search criteria"""
         if category and memory.get("category") != category:
@@ -110,8 +252,8 @@ class LCTMemorySystem:
             return False
         
         if tags:
-            memory_tags = memory.get("content", {}).get("tags", [])
-            if not any(tag in memory_tags for tag in tags):
+            memory_tags = memory.get("content", {}).get("tags") or ()
+            if tags.isdisjoint(memory_tags):
                 return False
         
         return True
@@ -122,8 +264,7 @@ class LCTMemorySystem:
         if not memory_file:
             return False
         
-        with open(memory_file) as f:
-            memory = json.load(f)
+        memory = copy.deepcopy(_read_memory(memory_file))
         
         # Update content
         if "content" in updates:
@@ -141,45 +282,212 @@ class LCTMemorySystem:
         return True
     
     def increment_access(self, memory_id: str) -> bool:
-        """Increment access count for a memory"""
-        memory_file = self._find_memory_file(memory_id)
-        if not memory_file:
+        """Increment access count for a memory
+        
+        Accesses are appended to a side log rather than rewriting the memory
+        file each time; fold_access_log() applies them during cleanup.
+        """
+        if not self._find_memory_file(memory_id):
             return False
         
-        with open(memory_file) as f:
-            memory = json.load(f)
+        with open(self.access_log, 'ab') as f:
+            f.write(f"{memory_id}\t{time.time_ns()}\n".encode())
+        return True
+    
+    def fold_access_log(self) -> int:
+        """Apply logged accesses to memory files, one rewrite per memory
         
-        memory["content"]["access_count"] = memory["content"].get("access_count", 0) + 1
-        memory["content"]["last_accessed"] = datetime.now().isoformat()
+        Folds are serialised on a lock file, so concurrent folds never read
+        (and apply) each other's pending logs.
+        """
+        with open(self.access_lock, 'wb') as lock_file:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            return self._fold_access_log_locked()
+    
+    def _fold_access_log_locked(self) -> int:
+        """Fold pending access logs; caller holds the access lock"""
+        # Claim the current log atomically so concurrent accesses start a new one
+        if self.access_log.exists():
+            os.replace(self.access_log, self.memory_dir / f"access_counts.{time.time_ns()}.folding")
         
-        self._save_memory_file(memory)
-        return True
+        # Leftovers from an interrupted fold are picked up here too
+        pending_logs = sorted(self.memory_dir.glob("access_counts.*.folding"))
+        accesses: Dict[str, List[int]] = {}
+        for pending_log in pending_logs:
+            with open(pending_log, 'rb') as f:
+                for line in f:
+                    memory_id, _, timestamp = line.decode().rstrip("\n").partition("\t")
+                    entry = accesses.setdefault(memory_id, [0, 0])
+                    entry[0] += 1
+                    entry[1] = max(entry[1], int(timestamp or 0))
+        
+        folded = 0
+        for memory_id, (count, last_ns) in accesses.items():
+            memory_file = self._find_memory_file(memory_id)
+            if not memory_file:
+                continue
+            
+            memory = copy.deepcopy(_read_memory(memory_file))
+            memory["content"]["access_count"] = memory["content"].get("access_count", 0) + count
+            memory["content"]["last_accessed"] = datetime.fromtimestamp(last_ns / 1e9).isoformat()
+            self._save_memory_file(memory)
+            folded += 1
+        
+        for pending_log in pending_logs:
+            pending_log.unlink(missing_ok=True)
+        
+        return folded
     
     def _save_memory_file(self, memory_data: Dict):
         """Save memory to file system"""
         category = memory_data["category"]
+        mtime_before = self._dir_mtime(category)
+        filepath, is_new = self._write_memory_file(memory_data)
+        self._add_to_dir_index(category, [filepath] if is_new else [], mtime_before)
+    
+    def _write_memory_file(self, memory_data: Dict) -> tuple:
+        """Write a memory file and index it; returns (path, is_new)
+        
+        The file is written aside and renamed into place. Besides never
+        leaving a half-written file, the rename updates the directory mtime,
+        so other instances notice rewrites as well as new files.
+        """
         memory_id = memory_data["memory_id"]
-        filename = f"{memory_id}.json"
-        filepath = self.memory_dir / category / filename
+        filepath = self._category_path(memory_data["category"]) + os.sep + memory_id + ".json"
+        
+        is_new = not os.path.exists(filepath)
+        tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(memory_data))
+        os.replace(tmp_path, filepath)
+        
+        self._index[memory_id] = filepath
+        self._index_file(filepath, memory_data)
+        return filepath, is_new
+    
+    def _dir_mtime(self, category: str) -> Optional[int]:
+        """Current mtime of a category directory, or None if it doesn't exist"""
+        try:
+            return os.stat(self._category_path(category)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
+    def _add_to_dir_index(self, category: str, filepaths: List[str],
+                          mtime_before: Optional[int]):
+        """Keep the index current without forcing a rescan of the directory
         
-        with open(filepath, 'w') as f:
-            json.dump(memory_data, f, indent=2)
+        mtime_before is the directory mtime taken before our writes. If it no
+        longer matches the indexed one, someone else changed files since the
+        last scan, so the index is dropped and the next query rescans.
+        """
+        if category not in self._dir_mtimes:
+            return
+        if mtime_before is not None and self._dir_mtimes[category] == mtime_before:
+            self._cat_index[category].extend(filepaths)
+            self._dir_mtimes[category] = self._dir_mtime(category)
+        else:
+            del self._dir_mtimes[category]
     
-    def _find_memory_file(self, memory_id: str) -> Optional[Path]:
+    def _find_memory_file(self, memory_id: str) -> Optional[str]:
         """Find memory file by ID"""
-        for category_dir in self.memory_dir.iterdir():
-            if category_dir.is_dir() and category_dir.name != "agents":
-                memory_file = category_dir / f"{memory_id}.json"
-                if memory_file.exists():
-                    return memory_file
-        return None
+        # IDs from add_memory start with their category - one stat in the common case
+        category = memory_id.split("_", 1)[0]
+        if category != "agents":
+            memory_file = self._category_path(category) + os.sep + memory_id + ".json"
+            if os.path.exists(memory_file):
+                return memory_file
+        
+        # Hand-written memories (e.g. initial project memories) don't follow that scheme
+        self._refresh_index_all()
+        return self._index.get(memory_id)
+    
+    def _category_path(self, category: str) -> str:
+        """Return the directory path string for a category"""
+        category_path = self._cat_paths.get(category)
+        if category_path is None:
+            category_path = self._cat_paths[category] = os.path.join(self._memory_dir_path, category)
+        return category_path
+    
+    def _refresh_index(self, category: str):
+        """Rescan a category directory if it changed since the last scan"""
+        category_path = self._category_path(category)
+        try:
+            mtime = os.stat(category_path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        
+        if category in self._dir_mtimes and self._dir_mtimes[category] == mtime:
+            return
+        
+        for memory_file in self._cat_index.pop(category, []):
+            memory_id = os.path.basename(memory_file)[:-5]
+            if self._index.get(memory_id) == memory_file:
+                del self._index[memory_id]
+            self._unindex_file(memory_file)
+        
+        names = []
+        if mtime is not None:
+            names = sorted(name for name in os.listdir(category_path) if name.endswith(".json"))
+        memory_files = self._cat_index[category] = []
+        for name in names:
+            memory_file = category_path + os.sep + name
+            memory_files.append(memory_file)
+            self._index.setdefault(name[:-5], memory_file)
+            self._index_file(memory_file, _read_memory(memory_file))
+        self._dir_mtimes[category] = mtime
+    
+    def _index_file(self, memory_file: str, memory: Dict):
+        """Record a file under its agent, type and tags"""
+        self._unindex_file(memory_file)
+        
+        agent = memory.get("metadata", {}).get("agent")
+        memory_type = memory.get("type")
+        tags = frozenset(memory.get("content", {}).get("tags") or ())
+        
+        self._agent_idx[agent].add(memory_file)
+        self._type_idx[memory_type].add(memory_file)
+        for tag in tags:
+            self._tag_idx[tag].add(memory_file)
+        self._file_keys[memory_file] = (agent, memory_type, tags)
+    
+    def _unindex_file(self, memory_file: str):
+        """Drop a file from the inverted indexes"""
+        keys = self._file_keys.pop(memory_file, None)
+        if keys is None:
+            return
+        
+        agent, memory_type, tags = keys
+        self._agent_idx[agent].discard(memory_file)
+        self._type_idx[memory_type].discard(memory_file)
+        for tag in tags:
+            self._tag_idx[tag].discard(memory_file)
+    
+    def _refresh_index_all(self):
+        """Refresh the category list and every category index"""
+        mtime = os.stat(self._memory_dir_path).st_mtime_ns
+        if mtime != self._root_mtime:
+            self._categories = sorted(
+                entry.name for entry in os.scandir(self._memory_dir_path)
+                if entry.is_dir() and entry.name != "agents"
+            )
+            self._root_mtime = mtime
+        
+        for category in self._categories:
+            self._refresh_index(category)
 
 class AgentMemoryIntegration:
     """Base class for agent memory integration"""
     
     def __init__(self, agent_name: str):
         self.agent_name = agent_name
-        self.memory_system = LCTMemorySystem()
+        self.memory_system = LCTMemorySystem.get_shared()
+        
+        # Tag sets are constant per agent, so build them once
+        agent_tag = agent_name.lower()
+        self._decision_tags = ("decision", agent_tag)
+        self._learning_tags = ("learning", agent_tag)
+        self._pattern_tags = ("pattern", agent_tag)
     
     def store_decision(self, decision: str, context: str, impact: str = "medium",
                       lct_criteria: Optional[str] = None) -> str:
@@ -191,7 +499,7 @@ class AgentMemoryIntegration:
                 "title": f"Decision: {decision}",
                 "description": f"Agent {self.agent_name} made decision: {decision}",
                 "context": context,
-                "tags": ["decision", self.agent_name.lower()],
+                "tags": self._decision_tags,
                 "priority": "medium"
             },
             metadata={
@@ -212,7 +520,7 @@ class AgentMemoryIntegration:
                 "title": f"Learning: {learning}",
                 "description": f"Agent {self.agent_name} learned: {learning}",
                 "context": f"Pattern: {pattern}",
-                "tags": ["learning", self.agent_name.lower()],
+                "tags": self._learning_tags,
                 "priority": "high"
             },
             metadata={
@@ -234,7 +542,7 @@ class AgentMemoryIntegration:
                 "title": f"Pattern: {pattern_name}",
                 "description": description,
                 "context": "Code pattern or best practice",
-                "tags": ["pattern", self.agent_name.lower()],
+                "tags": self._pattern_tags,
                 "priority": "high",
                 "code_example": code_example
             },
@@ -269,16 +577,8 @@ class AgentMemoryIntegration:
     
     def get_relevant_memories(self, query: str, limit: int = 5) -> List[Dict]:
         """Get memories relevant to current context"""
-        # Extract tags from query
-        tags = []
-        if "invoice" in query.lower():
-            tags.append("invoice")
-        if "validation" in query.lower():
-            tags.append("validation")
-        if "security" in query.lower():
-            tags.append("security")
-        if "teaching" in query.lower():
-            tags.append("teaching")
+        # Extract tags from query in a single scan
+        tags = list(dict.fromkeys(match.lower() for match in _TAG_RE.findall(query)))
         
         return self.memory_system.get_memories(
             tags=tags,
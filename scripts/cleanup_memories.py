@@ -4,53 +4,141 @@ Clean up expired and low-value memories
 """
 import json
 import os
-from datetime import datetime, timedelta
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
-def cleanup_expired_memories():
-    """Remove expired session memories"""
-    sessions_dir = Path("memory/sessions")
-    if not sessions_dir.exists():
-        return
+# Add the scripts directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agent_memory_integration import LCTMemorySystem
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Threads for the per-file cleanup checks
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Scalar fields the cleanup predicates read, by JSON path
+CLEANUP_FIELDS = (
+    "created_at",
+    "content.created_at",
+    "content.created_at_epoch",
+    "content.access_count",
+    "content.priority",
+)
+LOW_VALUE_FIELDS = ("content.access_count", "content.priority")
+EXPIRY_FIELDS = LOW_VALUE_FIELDS + ("content.created_at_epoch",)
+
+def _load_cleanup_fields(path, required):
+    """Read only the cleanup fields from a memory file
     
-    expired_count = 0
-    for memory_file in sessions_dir.glob("*.json"):
-        with open(memory_file) as f:
-            memory = json.load(f)
-        
-        # Check if memory is expired (24 hours for sessions)
-        created_at = datetime.fromisoformat(memory.get("created_at", "2025-01-01T00:00:00"))
-        if datetime.now() - created_at > timedelta(hours=24):
-            memory_file.unlink()
-            expired_count += 1
+    With ijson the file is streamed and parsing stops once every `required`
+    field has been seen; otherwise the whole file is parsed.
+    """
+    fields = {}
+    if IJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if prefix in CLEANUP_FIELDS and event not in ("start_map", "start_array"):
+                    fields[prefix] = value
+                    if all(field in fields for field in required):
+                        break
+        return fields
+    
+    memory = _json_loads(Path(path).read_bytes())
+    content = memory.get("content", {})
+    for field in CLEANUP_FIELDS:
+        source, _, key = field.rpartition(".")
+        scope = content if source else memory
+        if key in scope:
+            fields[field] = scope[key]
+    return fields
+
+def _created_before(created_at, cutoff, cutoff_iso):
+    """Whether an ISO-8601 created_at is older than the cutoff
     
-    print(f"🧹 Cleaned up {expired_count} expired session memories")
+    Naive timestamps sort chronologically as text, so they are compared
+    against cutoff_iso directly; only zone-qualified ones are parsed.
+    """
+    zone = created_at[19:]
+    if "+" in zone or "-" in zone or "Z" in zone:
+        return datetime.fromisoformat(created_at).timestamp() < cutoff
+    return created_at < cutoff_iso
 
-def cleanup_low_value_memories():
-    """Remove memories with low access count and priority"""
+def _check_memory(entry, category, cutoff, cutoff_iso):
+    """Return why a memory file should be removed ("expired"/"low_value"), or None"""
+    expires = category == "sessions"
+    
+    # Not written since the cutoff means created before it - no parse needed
+    if expires and entry.stat().st_mtime < cutoff:
+        return "expired"
+    
+    fields = _load_cleanup_fields(entry.path, EXPIRY_FIELDS if expires else LOW_VALUE_FIELDS)
+    
+    # Check if memory is expired (24 hours for sessions); add_memory stores
+    # an epoch timestamp under content, older files only the ISO string
+    if expires:
+        created_at_epoch = fields.get("content.created_at_epoch")
+        if created_at_epoch is not None:
+            if created_at_epoch < cutoff:
+                return "expired"
+        else:
+            created_at = fields.get("content.created_at") or fields.get("created_at", "2025-01-01T00:00:00")
+            if _created_before(created_at, cutoff, cutoff_iso):
+                return "expired"
+    
+    # Remove low-value memories
+    access_count = fields.get("content.access_count", 0)
+    priority = fields.get("content.priority", "medium")
+    if access_count < 2 and priority == "low":
+        return "low_value"
+    return None
+
+def fold_access_counts():
+    """Apply logged memory accesses so low-value checks see current counts"""
+    folded = LCTMemorySystem().fold_access_log()
+    print(f"🧹 Folded access counts into {folded} memories")
+
+def cleanup_memories():
+    """Remove expired session memories and low-value memories in one pass"""
+    cutoff = time.time() - 24 * 60 * 60
+    cutoff_iso = datetime.fromtimestamp(cutoff).isoformat()
     for category in ["development", "sessions"]:
         category_dir = Path(f"memory/{category}")
         if not category_dir.exists():
             continue
         
-        removed_count = 0
-        for memory_file in category_dir.glob("*.json"):
-            with open(memory_file) as f:
-                memory = json.load(f)
-            
-            content = memory.get("content", {})
-            access_count = content.get("access_count", 0)
-            priority = content.get("priority", "medium")
-            
-            # Remove low-value memories
-            if access_count < 2 and priority == "low":
-                memory_file.unlink()
-                removed_count += 1
+        with os.scandir(category_dir) as entries:
+            memory_files = [entry for entry in entries if entry.name.endswith(".json")]
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            reasons = list(executor.map(lambda e: _check_memory(e, category, cutoff, cutoff_iso), memory_files))
+        
+        # Delete on the main thread so workers never race on unlink
+        removed = {"expired": 0, "low_value": 0}
+        for entry, reason in zip(memory_files, reasons):
+            if reason:
+                os.unlink(entry.path)
+                removed[reason] += 1
         
-        print(f"🧹 Cleaned up {removed_count} low-value {category} memories")
+        if category == "sessions":
+            print(f"🧹 Cleaned up {removed['expired']} expired session memories")
+        print(f"🧹 Cleaned up {removed['low_value']} low-value {category} memories")
 
 if __name__ == "__main__":
     print("🧹 Cleaning up LCT Memory System...")
-    cleanup_expired_memories()
-    cleanup_low_value_memories()
+    fold_access_counts()
+    cleanup_memories()
     print("✅ Memory cleanup complete")
@@ -14,378 +14,508 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-def create_memory_structure():
-    """Create the memory directory structure"""
-    memory_dir = project_root / "memory"
-    
-    # Create main directories
-    directories = [
-        "project",
-        "development", 
-        "sessions",
-        "shared",
-        "agents"
-    ]
-    
-    for directory in directories:
-        dir_path = memory_dir / directory
-        dir_path.mkdir(parents=True, exist_ok=True)
-        print(f"✅ Created directory: {dir_path}")
-    
-    # Create agent-specific directories
-    agents = [
-        "primary_developer",
-        "sentinel",
-        "security_auditor", 
-        "documentation_writer"
-    ]
-    
-    for agent in agents:
-        agent_dir = memory_dir / "agents" / agent
-        agent_dir.mkdir(parents=True, exist_ok=True)
-        print(f"✅ Created agent directory: {agent_dir}")
-    
-    return memory_dir
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def create_memory_schema():
-    """Create the memory schema file"""
-    schema = {
-        "version": "1.0.0",
-        "created_at": datetime.now().isoformat(),
-        "description": "LCT Commit Memory System Schema",
-        "categories": {
-            "project": {
-                "description": "Long-term project context and business requirements",
-                "persistence": "permanent",
-                "examples": ["business_context", "technical_decisions", "success_criteria"]
-            },
-            "development": {
-                "description": "Mid-term development context and patterns",
-                "persistence": "semi-permanent",
-                "examples": ["code_patterns", "feature_history", "bug_resolutions"]
-            },
-            "sessions": {
-                "description": "Short-term session context",
-                "persistence": "temporary",
-                "examples": ["current_work", "active_issues", "user_preferences"]
-            },
-            "shared": {
-                "description": "Cross-agent shared knowledge",
-                "persistence": "permanent",
-                "examples": ["agent_interactions", "cross_agent_learnings", "system_insights"]
-            }
+# Schema and memory files are read by code, so they are written compact unless
+# a human asks for indented output with LCT_MEMORY_PRETTY=1
+PRETTY_MEMORY_FILES = os.environ.get("LCT_MEMORY_PRETTY") == "1"
+
+def _json_bytes(data, pretty: bool = PRETTY_MEMORY_FILES) -> bytes:
+    """Serialize data as JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
+
+# Flags for raw writes; O_CLOEXEC/O_BINARY only exist on some platforms
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+def _write_bytes(path, data: bytes, mode: int = 0o644):
+    """Write bytes with os.open/os.write, skipping Python's buffered file layers
+    
+    mode only applies when the file is created.
+    """
+    fd = os.open(path, _WRITE_FLAGS, mode)
+    try:
+        # Reserve the final size up front so the filesystem allocates once;
+        # it is only a hint, so unsupported filesystems are ignored
+        if data and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, len(data))
+            except OSError:
+                pass
+        
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+# Static init payloads, built once at import rather than on every call
+MEMORY_SCHEMA = {
+    "version": "1.0.0",
+    "created_at": None,  # stamped when the schema is written
+    "description": "LCT Commit Memory System Schema",
+    "categories": {
+        "project": {
+            "description": "Long-term project context and business requirements",
+            "persistence": "permanent",
+            "examples": ["business_context", "technical_decisions", "success_criteria"]
         },
-        "memory_types": {
-            "decision": "A decision made by an agent",
-            "learning": "Knowledge gained from experience",
-            "pattern": "A recurring pattern or best practice",
-            "preference": "User or system preference",
-            "issue": "A problem or blocker",
-            "insight": "A valuable insight or observation"
+        "development": {
+            "description": "Mid-term development context and patterns",
+            "persistence": "semi-permanent",
+            "examples": ["code_patterns", "feature_history", "bug_resolutions"]
         },
-        "metadata_fields": {
-            "lct_criteria": "Related LCT success criteria number",
-            "business_impact": "Impact on business goals (high/medium/low)",
-            "technical_complexity": "Technical complexity (high/medium/low)",
-            "user_skill_level": "Target user skill level (beginner/intermediate/advanced)"
+        "sessions": {
+            "description": "Short-term session context",
+            "persistence": "temporary",
+            "examples": ["current_work", "active_issues", "user_preferences"]
+        },
+        "shared": {
+            "description": "Cross-agent shared knowledge",
+            "persistence": "permanent",
+            "examples": ["agent_interactions", "cross_agent_learnings", "system_insights"]
         }
+    },
+    "memory_types": {
+        "decision": "A decision made by an agent",
+        "learning": "Knowledge gained from experience",
+        "pattern": "A recurring pattern or best practice",
+        "preference": "User or system preference",
+        "issue": "A problem or blocker",
+        "insight": "A valuable insight or observation"
+    },
+    "metadata_fields": {
+        "lct_criteria": "Related LCT success criteria number",
+        "business_impact": "Impact on business goals (high/medium/low)",
+        "technical_complexity": "Technical complexity (high/medium/low)",
+        "user_skill_level": "Target user skill level (beginner/intermediate/advanced)"
     }
-    
-    schema_file = project_root / "memory" / "schema.json"
-    with open(schema_file, 'w') as f:
-        json.dump(schema, f, indent=2)
-    
-    print(f"✅ Created memory schema: {schema_file}")
-    return schema_file
+}
 
-def create_initial_memories():
-    """Create initial project memories"""
-    initial_memories = [
-        {
-            "memory_id": "project_lct_context_001",
-            "category": "project",
-            "type": "decision",
-            "content": {
-                "title": "LCT-Vitraya Partnership Context",
-                "description": "Healthcare claims adjudication system for Kenya. Goal: 90%+ accuracy by October 7, 2025. Market: 1B KES immediate, 4.5B KES potential.",
-                "context": "Critical business context for all agents",
-                "tags": ["business", "partnership", "goals"],
-                "priority": "high"
-            },
-            "metadata": {
-                "lct_criteria": "all",
-                "business_impact": "high",
-                "technical_complexity": "high",
-                "user_skill_level": "beginner"
-            }
+INITIAL_MEMORIES = (
+    {
+        "memory_id": "project_lct_context_001",
+        "category": "project",
+        "type": "decision",
+        "content": {
+            "title": "LCT-Vitraya Partnership Context",
+            "description": "Healthcare claims adjudication system for Kenya. Goal: 90%+ accuracy by October 7, 2025. Market: 1B KES immediate, 4.5B KES potential.",
+            "context": "Critical business context for all agents",
+            "tags": ["business", "partnership", "goals"],
+            "priority": "high"
         },
-        {
-            "memory_id": "project_success_criteria_001",
-            "category": "project", 
-            "type": "decision",
-            "content": {
-                "title": "31 Success Criteria Framework",
-                "description": "31 evaluation criteria across 5 categories: 4 CRITICAL, 17 HIGH, 10 MEDIUM/LOW. Priority order: CRITICAL → High → Medium → Low.",
-                "context": "Core success framework for all agents",
-                "tags": ["criteria", "priority", "framework"],
-                "priority": "high"
-            },
-            "metadata": {
-                "lct_criteria": "all",
-                "business_impact": "high",
-                "technical_complexity": "medium",
-                "user_skill_level": "beginner"
-            }
-        },
-        {
-            "memory_id": "development_invoice_precedence_001",
-            "category": "development",
-            "type": "pattern",
-            "content": {
-                "title": "Invoice Amount Precedence Pattern",
-                "description": "Invoice amount precedence: LCT → ETIMS → Document. LCT amount always takes precedence (Criteria #4 - CRITICAL).",
-                "context": "Financial validation logic",
-                "tags": ["invoice", "validation", "precedence"],
-                "priority": "high"
-            },
-            "metadata": {
-                "lct_criteria": "4",
-                "business_impact": "high",
-                "technical_complexity": "medium",
-                "user_skill_level": "beginner"
-            }
-        },
-        {
-            "memory_id": "development_teaching_approach_001",
-            "category": "development",
-            "type": "pattern",
-            "content": {
-                "title": "Beginner-Friendly Teaching Pattern",
-                "description": "Small incremental steps, extensive comments, one feature at a time, test after each step. Explain in 3 levels: what it does, how it works, why it matters.",
-                "context": "Teaching approach for beginner users",
-                "tags": ["teaching", "beginner", "methodology"],
-                "priority": "high"
-            },
-            "metadata": {
-                "lct_criteria": "all",
-                "business_impact": "medium",
-                "technical_complexity": "low",
-                "user_skill_level": "beginner"
-            }
+        "metadata": {
+            "lct_criteria": "all",
+            "business_impact": "high",
+            "technical_complexity": "high",
+            "user_skill_level": "beginner"
         }
-    ]
-    
-    memories_dir = project_root / "memory" / "project"
-    for memory in initial_memories:
-        memory_file = memories_dir / f"{memory['memory_id']}.json"
-        with open(memory_file, 'w') as f:
-            json.dump(memory, f, indent=2)
-        print(f"✅ Created initial memory: {memory['memory_id']}")
-    
-    return initial_memories
-
-def create_agent_memory_configs():
-    """Create memory configuration files for each agent"""
-    agents = {
-        "primary_developer": {
-            "description": "Interactive coding assistant for LCT Commit project",
-            "memory_responsibilities": [
-                "Store coding patterns and best practices",
-                "Remember user preferences and skill level", 
-                "Track feature implementation decisions",
-                "Learn from successful teaching approaches"
-            ],
-            "memory_categories": ["development", "sessions", "shared"],
-            "memory_types": ["decision", "learning", "pattern", "preference"]
+    },
+    {
+        "memory_id": "project_success_criteria_001",
+        "category": "project", 
+        "type": "decision",
+        "content": {
+            "title": "31 Success Criteria Framework",
+            "description": "31 evaluation criteria across 5 categories: 4 CRITICAL, 17 HIGH, 10 MEDIUM/LOW. Priority order: CRITICAL → High → Medium → Low.",
+            "context": "Core success framework for all agents",
+            "tags": ["criteria", "priority", "framework"],
+            "priority": "high"
         },
-        "sentinel": {
-            "description": "Automated code review agent for security and quality",
-            "memory_responsibilities": [
-                "Store security patterns and vulnerabilities",
-                "Remember code quality standards",
-                "Track issue resolution patterns", 
-                "Learn from false positives/negatives"
-            ],
-            "memory_categories": ["development", "shared"],
-            "memory_types": ["pattern", "learning", "issue"]
+        "metadata": {
+            "lct_criteria": "all",
+            "business_impact": "high",
+            "technical_complexity": "medium",
+            "user_skill_level": "beginner"
+        }
+    },
+    {
+        "memory_id": "development_invoice_precedence_001",
+        "category": "development",
+        "type": "pattern",
+        "content": {
+            "title": "Invoice Amount Precedence Pattern",
+            "description": "Invoice amount precedence: LCT → ETIMS → Document. LCT amount always takes precedence (Criteria #4 - CRITICAL).",
+            "context": "Financial validation logic",
+            "tags": ["invoice", "validation", "precedence"],
+            "priority": "high"
         },
-        "security_auditor": {
-            "description": "Deep security analysis and compliance checking",
-            "memory_responsibilities": [
-                "Store compliance requirements",
-                "Remember security incidents",
-                "Track audit findings and resolutions",
-                "Learn from security best practices"
-            ],
-            "memory_categories": ["project", "development", "shared"],
-            "memory_types": ["decision", "learning", "pattern", "issue"]
+        "metadata": {
+            "lct_criteria": "4",
+            "business_impact": "high",
+            "technical_complexity": "medium",
+            "user_skill_level": "beginner"
+        }
+    },
+    {
+        "memory_id": "development_teaching_approach_001",
+        "category": "development",
+        "type": "pattern",
+        "content": {
+            "title": "Beginner-Friendly Teaching Pattern",
+            "description": "Small incremental steps, extensive comments, one feature at a time, test after each step. Explain in 3 levels: what it does, how it works, why it matters.",
+            "context": "Teaching approach for beginner users",
+            "tags": ["teaching", "beginner", "methodology"],
+            "priority": "high"
         },
-        "documentation_writer": {
-            "description": "On-demand documentation and comment generation",
-            "memory_responsibilities": [
-                "Store documentation patterns",
-                "Remember user feedback on docs",
-                "Track knowledge gaps",
-                "Learn from effective documentation"
-            ],
-            "memory_categories": ["development", "sessions", "shared"],
-            "memory_types": ["pattern", "learning", "preference"]
+        "metadata": {
+            "lct_criteria": "all",
+            "business_impact": "medium",
+            "technical_complexity": "low",
+            "user_skill_level": "beginner"
         }
     }
-    
-    agents_dir = project_root / "memory" / "agents"
-    for agent_name, config in agents.items():
-        config_file = agents_dir / agent_name / "config.json"
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-        print(f"✅ Created agent config: {agent_name}")
-    
-    return agents
+)
 
-def create_memory_scripts():
-    """Create utility scripts for memory management"""
-    scripts = {
-        "test_memory_system.py": '''#!/usr/bin/env python3
+AGENT_CONFIGS = {
+    "primary_developer": {
+        "description": "Interactive coding assistant for LCT Commit project",
+        "memory_responsibilities": [
+            "Store coding patterns and best practices",
+            "Remember user preferences and skill level", 
+            "Track feature implementation decisions",
+            "Learn from successful teaching approaches"
+        ],
+        "memory_categories": ["development", "sessions", "shared"],
+        "memory_types": ["decision", "learning", "pattern", "preference"]
+    },
+    "sentinel": {
+        "description": "Automated code review agent for security and quality",
+        "memory_responsibilities": [
+            "Store security patterns and vulnerabilities",
+            "Remember code quality standards",
+            "Track issue resolution patterns", 
+            "Learn from false positives/negatives"
+        ],
+        "memory_categories": ["development", "shared"],
+        "memory_types": ["pattern", "learning", "issue"]
+    },
+    "security_auditor": {
+        "description": "Deep security analysis and compliance checking",
+        "memory_responsibilities": [
+            "Store compliance requirements",
+            "Remember security incidents",
+            "Track audit findings and resolutions",
+            "Learn from security best practices"
+        ],
+        "memory_categories": ["project", "development", "shared"],
+        "memory_types": ["decision", "learning", "pattern", "issue"]
+    },
+    "documentation_writer": {
+        "description": "On-demand documentation and comment generation",
+        "memory_responsibilities": [
+            "Store documentation patterns",
+            "Remember user feedback on docs",
+            "Track knowledge gaps",
+            "Learn from effective documentation"
+        ],
+        "memory_categories": ["development", "sessions", "shared"],
+        "memory_types": ["pattern", "learning", "preference"]
+    }
+}
+
+# Utility scripts written by init, mirroring the checked-in copies
+_SCRIPT_TEMPLATES = {
+    "test_memory_system.py": '''#!/usr/bin/env python3
 """
 Test the LCT Memory System
 """
+import os
 import sys
-import json
-from pathlib import Path
 
-def test_memory_structure():
+MEMORY_DIR = "memory"
+
+# (name, path) for each directory test_memory_structure requires
+REQUIRED_DIRS = tuple(
+    (name, os.path.join(MEMORY_DIR, name))
+    for name in ("project", "development", "sessions", "shared", "agents")
+)
+FOUND_DIR_PREFIX = "✅ Found directory: "
+MISSING_DIR_PREFIX = "❌ Missing directory: "
+
+def _scan_memory():
+    """Walk memory/ once for both tests
+    
+    Returns the names of the directories directly under memory/ and the
+    number of *.json files in memory/project.
+    """
+    found_dirs = set()
+    project_json_count = 0
+    try:
+        # is_dir(follow_symlinks=False) uses the cached d_type, so no extra stat
+        with os.scandir(MEMORY_DIR) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                found_dirs.add(entry.name)
+                if entry.name == "project":
+                    # Only names are needed here, so plain listdir strings will do
+                    project_json_count = sum(1 for name in os.listdir(entry.path) if name.endswith(".json"))
+    except FileNotFoundError:
+        pass
+    return found_dirs, project_json_count
+
+def test_memory_structure(found_dirs=None):
     """Test that memory structure exists"""
-    memory_dir = Path("memory")
+    if found_dirs is None:
+        found_dirs, _ = _scan_memory()
     
-    required_dirs = ["project", "development", "sessions", "shared", "agents"]
-    for dir_name in required_dirs:
-        dir_path = memory_dir / dir_name
-        if not dir_path.exists():
-            print(f"❌ Missing directory: {dir_path}")
-            return False
-        print(f"✅ Found directory: {dir_path}")
+    missing = {name for name, _ in REQUIRED_DIRS} - found_dirs
     
-    return True
+    # Report lines are written in one go rather than a print per directory
+    if missing:
+        lines = [MISSING_DIR_PREFIX + path for name, path in REQUIRED_DIRS if name in missing]
+    else:
+        lines = [FOUND_DIR_PREFIX + path for _, path in REQUIRED_DIRS]
+    sys.stdout.write("\\n".join(lines) + "\\n")
+    
+    return not missing
 
-def test_initial_memories():
+def test_initial_memories(project_json_count=None):
     """Test that initial memories exist"""
-    project_dir = Path("memory/project")
-    memory_files = list(project_dir.glob("*.json"))
+    if project_json_count is None:
+        _, project_json_count = _scan_memory()
     
-    if len(memory_files) == 0:
+    if project_json_count == 0:
         print("❌ No initial memories found")
         return False
     
-    print(f"✅ Found {len(memory_files)} initial memories")
+    print(f"✅ Found {project_json_count} initial memories")
     return True
 
 if __name__ == "__main__":
     print("🧠 Testing LCT Memory System...")
     
-    if test_memory_structure() and test_initial_memories():
+    found_dirs, project_json_count = _scan_memory()
+    if test_memory_structure(found_dirs) and test_initial_memories(project_json_count):
         print("✅ Memory system test passed")
         sys.exit(0)
     else:
         print("❌ Memory system test failed")
         sys.exit(1)
 ''',
-        "cleanup_memories.py": '''#!/usr/bin/env python3
+    "cleanup_memories.py": '''#!/usr/bin/env python3
 """
 Clean up expired and low-value memories
 """
 import json
 import os
-from datetime import datetime, timedelta
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
-def cleanup_expired_memories():
-    """Remove expired session memories"""
-    sessions_dir = Path("memory/sessions")
-    if not sessions_dir.exists():
-        return
-    
-    expired_count = 0
-    for memory_file in sessions_dir.glob("*.json"):
-        with open(memory_file) as f:
-            memory = json.load(f)
-        
-        # Check if memory is expired (24 hours for sessions)
-        created_at = datetime.fromisoformat(memory.get("created_at", "2025-01-01T00:00:00"))
-        if datetime.now() - created_at > timedelta(hours=24):
-            memory_file.unlink()
-            expired_count += 1
-    
-    print(f"🧹 Cleaned up {expired_count} expired session memories")
+# Add the scripts directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agent_memory_integration import LCTMemorySystem
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
-def cleanup_low_value_memories():
-    """Remove memories with low access count and priority"""
+# Threads for the per-file cleanup checks
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Scalar fields the cleanup predicates read, by JSON path
+CLEANUP_FIELDS = (
+    "created_at",
+    "content.created_at",
+    "content.created_at_epoch",
+    "content.access_count",
+    "content.priority",
+)
+LOW_VALUE_FIELDS = ("content.access_count", "content.priority")
+EXPIRY_FIELDS = LOW_VALUE_FIELDS + ("content.created_at_epoch",)
+
+def _load_cleanup_fields(path, required):
+    """Read only the cleanup fields from a memory file
+    
+    With ijson the file is streamed and parsing stops once every `required`
+    field has been seen; otherwise the whole file is parsed.
+    """
+    fields = {}
+    if IJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if prefix in CLEANUP_FIELDS and event not in ("start_map", "start_array"):
+                    fields[prefix] = value
+                    if all(field in fields for field in required):
+                        break
+        return fields
+    
+    memory = _json_loads(Path(path).read_bytes())
+    content = memory.get("content", {})
+    for field in CLEANUP_FIELDS:
+        source, _, key = field.rpartition(".")
+        scope = content if source else memory
+        if key in scope:
+            fields[field] = scope[key]
+    return fields
+
+def _created_before(created_at, cutoff, cutoff_iso):
+    """Whether an ISO-8601 created_at is older than the cutoff
+    
+    Naive timestamps sort chronologically as text, so they are compared
+    against cutoff_iso directly; only zone-qualified ones are parsed.
+    """
+    zone = created_at[19:]
+    if "+" in zone or "-" in zone or "Z" in zone:
+        return datetime.fromisoformat(created_at).timestamp() < cutoff
+    return created_at < cutoff_iso
+
+def _check_memory(entry, category, cutoff, cutoff_iso):
+    """Return why a memory file should be removed ("expired"/"low_value"), or None"""
+    expires = category == "sessions"
+    
+    # Not written since the cutoff means created before it - no parse needed
+    if expires and entry.stat().st_mtime < cutoff:
+        return "expired"
+    
+    fields = _load_cleanup_fields(entry.path, EXPIRY_FIELDS if expires else LOW_VALUE_FIELDS)
+    
+    # Check if memory is expired (24 hours for sessions); add_memory stores
+    # an epoch timestamp under content, older files only the ISO string
+    if expires:
+        created_at_epoch = fields.get("content.created_at_epoch")
+        if created_at_epoch is not None:
+            if created_at_epoch < cutoff:
+                return "expired"
+        else:
+            created_at = fields.get("content.created_at") or fields.get("created_at", "2025-01-01T00:00:00")
+            if _created_before(created_at, cutoff, cutoff_iso):
+                return "expired"
+    
+    # Remove low-value memories
+    access_count = fields.get("content.access_count", 0)
+    priority = fields.get("content.priority", "medium")
+    if access_count < 2 and priority == "low":
+        return "low_value"
+    return None
+
+def fold_access_counts():
+    """Apply logged memory accesses so low-value checks see current counts"""
+    folded = LCTMemorySystem().fold_access_log()
+    print(f"🧹 Folded access counts into {folded} memories")
+
+def cleanup_memories():
+    """Remove expired session memories and low-value memories in one pass"""
+    cutoff = time.time() - 24 * 60 * 60
+    cutoff_iso = datetime.fromtimestamp(cutoff).isoformat()
     for category in ["development", "sessions"]:
         category_dir = Path(f"memory/{category}")
         if not category_dir.exists():
             continue
         
-        removed_count = 0
-        for memory_file in category_dir.glob("*.json"):
-            with open(memory_file) as f:
-                memory = json.load(f)
-            
-            content = memory.get("content", {})
-            access_count = content.get("access_count", 0)
-            priority = content.get("priority", "medium")
-            
-            # Remove low-value memories
-            if access_count < 2 and priority == "low":
-                memory_file.unlink()
-                removed_count += 1
+        with os.scandir(category_dir) as entries:
+            memory_files = [entry for entry in entries if entry.name.endswith(".json")]
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            reasons = list(executor.map(lambda e: _check_memory(e, category, cutoff, cutoff_iso), memory_files))
         
-        print(f"🧹 Cleaned up {removed_count} low-value {category} memories")
+        # Delete on the main thread so workers never race on unlink
+        removed = {"expired": 0, "low_value": 0}
+        for entry, reason in zip(memory_files, reasons):
+            if reason:
+                os.unlink(entry.path)
+                removed[reason] += 1
+        
+        if category == "sessions":
+            print(f"🧹 Cleaned up {removed['expired']} expired session memories")
+        print(f"🧹 Cleaned up {removed['low_value']} low-value {category} memories")
 
 if __name__ == "__main__":
     print("🧹 Cleaning up LCT Memory System...")
-    cleanup_expired_memories()
-    cleanup_low_value_memories()
+    fold_access_counts()
+    cleanup_memories()
     print("✅ Memory cleanup complete")
 ''',
-        "memory_analytics.py": '''#!/usr/bin/env python3
+    "memory_analytics.py": '''#!/usr/bin/env python3
 """
 Analyze memory system usage and effectiveness
 """
 import json
 import os
+import sys
 from pathlib import Path
-from collections import defaultdict, Counter
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def stats_to_json(stats):
+        """Serialize analytics stats to indented JSON bytes"""
+        return orjson.dumps(stats, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+    
+    def stats_to_json(stats):
+        """Serialize analytics stats to indented JSON bytes"""
+        return json.dumps(stats, indent=2).encode()
+
+# Threads for parsing memory files
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def parse_one(category, memory_file):
+    """Parse a memory file into its (category, type, priority, agent) counters"""
+    with open(memory_file, 'rb') as f:
+        memory = _json_loads(f.read())
+    return (
+        category,
+        memory.get("type", "unknown"),
+        memory.get("content", {}).get("priority", "unknown"),
+        # Extract agent from metadata
+        memory.get("metadata", {}).get("agent", "unknown"),
+    )
 
 def analyze_memory_usage():
     """Analyze memory usage by category and agent"""
-    stats = {
-        "total_memories": 0,
-        "by_category": defaultdict(int),
-        "by_type": defaultdict(int),
-        "by_agent": defaultdict(int),
-        "by_priority": defaultdict(int)
-    }
-    
     memory_dir = Path("memory")
     
-    for category_dir in memory_dir.iterdir():
-        if category_dir.is_file():
-            continue
-            
-        category = category_dir.name
-        for memory_file in category_dir.glob("*.json"):
-            with open(memory_file) as f:
-                memory = json.load(f)
+    # Collect every file first so parsing can fan out across threads;
+    # DirEntry caches the file type from readdir, so no per-entry stat
+    memory_files = []
+    with os.scandir(memory_dir) as categories:
+        for category_entry in categories:
+            if not category_entry.is_dir(follow_symlinks=False):
+                continue
             
-            stats["total_memories"] += 1
-            stats["by_category"][category] += 1
-            stats["by_type"][memory.get("type", "unknown")] += 1
-            stats["by_priority"][memory.get("content", {}).get("priority", "unknown")] += 1
-            
-            # Extract agent from metadata
-            agent = memory.get("metadata", {}).get("agent", "unknown")
-            stats["by_agent"][agent] += 1
-    
-    return stats
+            with os.scandir(category_entry.path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        memory_files.append((category_entry.name, entry.path))
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        records = list(executor.map(lambda item: parse_one(*item), memory_files))
+    
+    # Transpose the per-file tuples so each column is counted by Counter in C;
+    # results are plain dicts so they serialize without per-key dispatch
+    categories, types, priorities, agents = zip(*records) if records else ((), (), (), ())
+    return {
+        "total_memories": len(records),
+        "by_category": dict(Counter(categories)),
+        "by_type": dict(Counter(types)),
+        "by_agent": dict(Counter(agents)),
+        "by_priority": dict(Counter(priorities))
+    }
 
 def print_analytics(stats):
     """Print memory analytics"""
@@ -414,19 +544,101 @@ def print_analytics(stats):
         print(f"  {agent}: {count}")
 
 if __name__ == "__main__":
+    # --json writes the raw stats as one JSON document for reports and tooling
+    if "--json" in sys.argv[1:]:
+        sys.stdout.buffer.write(stats_to_json(analyze_memory_usage()) + b"\\n")
+        sys.exit(0)
+    
     print("📊 Analyzing LCT Memory System...")
     stats = analyze_memory_usage()
     print_analytics(stats)
 '''
-    }
+}
+
+# Encoded once so each init run is a plain byte write per script
+MEMORY_SCRIPTS = tuple((name, template.encode()) for name, template in _SCRIPT_TEMPLATES.items())
+
+def create_memory_structure():
+    """Create the memory directory structure"""
+    memory_dir = project_root / "memory"
+    
+    # Create main directories
+    directories = [
+        "project",
+        "development", 
+        "sessions",
+        "shared",
+        "agents"
+    ]
+    
+    # Create agent-specific directories
+    agents = list(AGENT_CONFIGS)
+    
+    # Only leaf paths are needed - makedirs creates "agents" along the way
+    already_initialized = memory_dir.exists()
+    leaves = [memory_dir / directory for directory in directories if directory != "agents"]
+    leaves += [memory_dir / "agents" / agent for agent in agents]
+    for leaf in leaves:
+        os.makedirs(leaf, exist_ok=True)
+    
+    if already_initialized:
+        print(f"✅ Memory directories in place: {memory_dir}")
+    else:
+        for leaf in leaves:
+            print(f"✅ Created directory: {leaf}")
+    
+    return memory_dir
+
+def create_memory_schema():
+    """Create the memory schema file"""
+    schema = {**MEMORY_SCHEMA, "created_at": datetime.now().isoformat()}
+    
+    schema_file = project_root / "memory" / "schema.json"
+    _write_bytes(schema_file, _json_bytes(schema))
+    
+    print(f"✅ Created memory schema: {schema_file}")
+    return schema_file
+
+def create_initial_memories():
+    """Create initial project memories; returns how many files were written"""
+    memories_dir = project_root / "memory" / "project"
+    written = 0
+    for memory in INITIAL_MEMORIES:
+        memory_file = memories_dir / f"{memory['memory_id']}.json"
+        data = _json_bytes(memory)
+        
+        # Re-running init leaves identical files alone instead of rewriting them
+        if memory_file.exists() and memory_file.read_bytes() == data:
+            print(f"✅ Initial memory up to date: {memory['memory_id']}")
+            continue
+        
+        _write_bytes(memory_file, data)
+        written += 1
+        print(f"✅ Created initial memory: {memory['memory_id']}")
+    
+    return written
+
+def create_agent_memory_configs():
+    """Create memory configuration files for each agent"""
+    agents_dir = project_root / "memory" / "agents"
+    for agent_name, config in AGENT_CONFIGS.items():
+        config_file = agents_dir / agent_name / "config.json"
+        # Agent configs are meant to be read and edited by hand
+        _write_bytes(config_file, _json_bytes(config, pretty=True))
+        print(f"✅ Created agent config: {agent_name}")
     
+    return AGENT_CONFIGS
+
+def create_memory_scripts():
+    """Create utility scripts for memory management"""
     scripts_dir = project_root / "scripts"
-    for script_name, script_content in scripts.items():
-        script_file = scripts_dir / script_name
-        with open(script_file, 'w') as f:
-            f.write(script_content)
-        os.chmod(script_file, 0o755)
+    for script_name, data in MEMORY_SCRIPTS:
+        _write_bytes(scripts_dir / script_name, data, mode=0o755)
         print(f"✅ Created script: {script_name}")
+    
+    # os.open only applies the mode (less umask) to newly created files
+    for script_name, _ in MEMORY_SCRIPTS:
+        os.chmod(scripts_dir / script_name, 0o755)
 
 def main():
     """Initialize the LCT Memory System"""
@@ -441,8 +653,8 @@ def main():
     schema_file = create_memory_schema()
     
     # Create initial memories
-    initial_memories = create_initial_memories()
-    print(f"📝 Created {len(initial_memories)} initial memories")
+    written = create_initial_memories()
+    print(f"📝 Created {written} initial memories ({len(INITIAL_MEMORIES) - written} already up to date)")
     
     # Create agent configurations
     agents = create_agent_memory_configs()
@@ -5,8 +5,13 @@ Local memory system using mem0ai library
 """
 
 import os
+import importlib.util
 import json
+import logging
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -15,16 +20,44 @@ from typing import Dict, List, Optional, Any
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-try:
-    from mem0 import Memory
-    MEM0AI_AVAILABLE = True
-except ImportError:
-    MEM0AI_AVAILABLE = False
+# mem0 itself is imported in LCTMem0aiSystem.__init__
+MEM0AI_AVAILABLE = importlib.util.find_spec("mem0") is not None
+if not MEM0AI_AVAILABLE:
     print("⚠️ mem0ai not installed. Run: pip install mem0ai")
 
+# Per-call status goes through logging so hot paths skip formatting unless
+# debug output is enabled
+logger = logging.getLogger("lct.mem0ai")
+
+# Background writer coalescing: flush after this many items or this many seconds
+MAX_BATCH = 50
+BATCH_WINDOW = 0.1
+
+class FailedSearch(list):
+    """Empty search result returned when mem0ai errors - not a real answer, so don't cache it"""
+
+class FailedChat(str):
+    """Fallback chat reply returned when mem0ai errors - not a real answer, so don't cache it"""
+
 class LCTMem0aiSystem:
     """Local memory system using mem0ai library"""
     
+    # One instance per distinct config, so agents share the Qdrant store and LLM client
+    _shared: Dict[str, "LCTMem0aiSystem"] = {}
+    _shared_lock = threading.Lock()
+    
+    @classmethod
+    def get_shared(cls, config: Optional[Dict] = None) -> "LCTMem0aiSystem":
+        """Return the process-wide instance for this config"""
+        key = json.dumps(config, sort_keys=True, default=str)
+        instance = cls._shared.get(key)
+        if instance is None:
+            with cls._shared_lock:
+                instance = cls._shared.get(key)
+                if instance is None:
+                    instance = cls._shared[key] = cls(config)
+        return instance
+    
     def __init__(self, config: Optional[Dict] = None):
         self.project_root = project_root
         self.memory_dir = self.project_root / "memory"
@@ -54,66 +87,142 @@ class LCTMem0aiSystem:
             default_config.update(config)
         
         # Initialize mem0ai
+        try:
+            from mem0 import Memory
+        except ImportError as e:
+            raise ImportError(f"mem0ai could not be imported ({e}). Run: pip install mem0ai") from e
         self.memory = Memory.from_config(default_config)
         
         # Create memory directory
         self.memory_dir.mkdir(exist_ok=True)
+        
+        # Bumped on every write so agents sharing this system can tell their
+        # cached lookups are stale
+        self.generation = 0
+        
+        # Queued writes are drained by a writer thread started on first use
+        self._queue = queue.Queue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
     
     def add_memory(self, content: str, metadata: Dict[str, Any] = None, user_id: str = "lct_user") -> str:
         """Add memory using mem0ai"""
         try:
             result = self.memory.add(content, metadata=metadata or {}, user_id=user_id)
+            self.generation += 1
             memory_id = result.get('id', f"mem0ai_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
             
-            print(f"✅ Memory added: {memory_id}")
+            logger.debug("✅ Memory added: %s", memory_id)
             return memory_id
             
         except Exception as e:
-            print(f"❌ mem0ai error: {e}")
+            logger.error("❌ mem0ai error: %s", e)
             return None
     
+    def queue_memory(self, content: str, metadata: Dict[str, Any] = None, user_id: str = "lct_user") -> None:
+        """Queue a memory for the background writer instead of adding it inline
+        
+        Queued memories have no id to return; call flush() before relying on
+        them being searchable.
+        """
+        self._start_writer()
+        self._queue.put((content, metadata or {}, user_id))
+    
+    def flush(self) -> None:
+        """Block until every queued memory has been written"""
+        if self._writer is not None:
+            self._queue.join()
+    
+    def _start_writer(self):
+        """Start the background writer thread if it is not running yet"""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._drain, name="lct-mem0ai-writer", daemon=True)
+                self._writer.start()
+    
+    def _drain(self):
+        """Pull queued memories in batches and write each batch"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + BATCH_WINDOW
+            while len(batch) < MAX_BATCH:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def _write_batch(self, batch: List[tuple]):
+        """Write a batch, sharing one add call per (user_id, metadata) group"""
+        # Items with different users or metadata cannot share a call without
+        # losing their metadata, so only identical ones are coalesced
+        groups = {}
+        for content, metadata, user_id in batch:
+            key = (user_id, json.dumps(metadata, sort_keys=True, default=str))
+            groups.setdefault(key, (metadata, user_id, []))[2].append({"role": "user", "content": content})
+        
+        for metadata, user_id, messages in groups.values():
+            try:
+                self.memory.add(messages, metadata=metadata, user_id=user_id)
+                self.generation += 1
+                logger.debug("✅ Batched %d memories for %s", len(messages), user_id)
+            except Exception as e:
+                logger.error("❌ mem0ai batch error: %s", e)
+    
     def search_memories(self, query: str, limit: int = 10, user_id: str = "lct_user") -> List[Dict]:
         """Search memories using mem0ai"""
         try:
             results = self.memory.search(query, limit=limit, user_id=user_id)
-            print(f"🔍 Found {len(results)} memories for: {query}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🔍 Found %d memories for: %s", len(results), query)
             return results
             
         except Exception as e:
-            print(f"❌ mem0ai search error: {e}")
-            return []
+            logger.error("❌ mem0ai search error: %s", e)
+            return FailedSearch()
     
     def get_all_memories(self, limit: int = 100) -> List[Dict]:
         """Get all memories from mem0ai"""
         try:
             results = self.memory.get_all(limit=limit)
-            print(f"📚 Retrieved {len(results)} memories")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📚 Retrieved %d memories", len(results))
             return results
             
         except Exception as e:
-            print(f"❌ mem0ai get_all error: {e}")
+            logger.error("❌ mem0ai get_all error: %s", e)
             return []
     
     def update_memory(self, memory_id: str, content: str, metadata: Dict[str, Any] = None) -> bool:
         """Update memory in mem0ai"""
         try:
             result = self.memory.update(memory_id, content, metadata=metadata)
-            print(f"✅ Memory updated: {memory_id}")
+            self.generation += 1
+            logger.debug("✅ Memory updated: %s", memory_id)
             return True
             
         except Exception as e:
-            print(f"❌ mem0ai update error: {e}")
+            logger.error("❌ mem0ai update error: %s", e)
             return False
     
     def delete_memory(self, memory_id: str) -> bool:
         """Delete memory from mem0ai"""
         try:
             result = self.memory.delete(memory_id)
-            print(f"✅ Memory deleted: {memory_id}")
+            self.generation += 1
+            logger.debug("✅ Memory deleted: %s", memory_id)
             return True
             
         except Exception as e:
-            print(f"❌ mem0ai delete error: {e}")
+            logger.error("❌ mem0ai delete error: %s", e)
             return False
     
     def chat(self, message: str, user_id: str = "lct_user") -> str:
@@ -122,15 +231,30 @@ class LCTMem0aiSystem:
             response = self.memory.chat(message, user_id=user_id)
             return response
         except Exception as e:
-            print(f"❌ mem0ai chat error: {e}")
-            return "Sorry, I couldn't process that request."
+            logger.error("❌ mem0ai chat error: %s", e)
+            return FailedChat("Sorry, I couldn't process that request.")
 
 class LCTMem0aiAgentIntegration:
     """Agent memory integration using mem0ai"""
     
-    def __init__(self, agent_name: str, config: Optional[Dict] = None):
+    def __init__(self, agent_name: str, config: Optional[Dict] = None, batch_writes: bool = False):
         self.agent_name = agent_name
-        self.mem0ai_system = LCTMem0aiSystem(config)
+        self.mem0ai_system = LCTMem0aiSystem.get_shared(config)
+        self._user_id = f"{agent_name}_user"
+        
+        # With batch_writes, store_* queue for the background writer and return None
+        self.batch_writes = batch_writes
+    
+    def _store(self, content: str, metadata: Dict[str, Any]) -> Optional[str]:
+        """Add or queue a memory depending on batch_writes"""
+        if self.batch_writes:
+            self.mem0ai_system.queue_memory(content, metadata, user_id=self._user_id)
+            return None
+        return self.mem0ai_system.add_memory(content, metadata, user_id=self._user_id)
+    
+    def flush(self) -> None:
+        """Wait for queued memories to be written"""
+        self.mem0ai_system.flush()
     
     def store_decision(self, decision: str, context: str, impact: str = "medium",
                       lct_criteria: Optional[str] = None) -> str:
@@ -144,7 +268,7 @@ class LCTMem0aiAgentIntegration:
             "context": context
         }
         
-        return self.mem0ai_system.add_memory(content, metadata, user_id=f"{self.agent_name}_user")
+        return self._store(content, metadata)
     
     def store_learning(self, learning: str, pattern: str, success_rate: float = 0.0,
                       lct_criteria: Optional[str] = None) -> str:
@@ -158,7 +282,7 @@ class LCTMem0aiAgentIntegration:
             "lct_criteria": lct_criteria
         }
         
-        return self.mem0ai_system.add_memory(content, metadata, user_id=f"{self.agent_name}_user")
+        return self._store(content, metadata)
     
     def store_pattern(self, pattern_name: str, description: str, 
                      code_example: Optional[str] = None) -> str:
@@ -174,15 +298,15 @@ class LCTMem0aiAgentIntegration:
             "code_example": code_example
         }
         
-        return self.mem0ai_system.add_memory(content, metadata, user_id=f"{self.agent_name}_user")
+        return self._store(content, metadata)
     
     def get_relevant_memories(self, query: str, limit: int = 5) -> List[Dict]:
         """Get relevant memories using mem0ai search"""
-        return self.mem0ai_system.search_memories(query, limit, user_id=f"{self.agent_name}_user")
+        return self.mem0ai_system.search_memories(query, limit, user_id=self._user_id)
     
     def chat_with_memory(self, message: str) -> str:
         """Chat with the memory system"""
-        return self.mem0ai_system.chat(message, user_id=f"{self.agent_name}_user")
+        return self.mem0ai_system.chat(message, user_id=self._user_id)
 
 def test_mem0ai_integration():
     """Test mem0ai integration"""
@@ -4,40 +4,70 @@ Analyze memory system usage and effectiveness
 """
 import json
 import os
+import sys
 from pathlib import Path
-from collections import defaultdict, Counter
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def stats_to_json(stats):
+        """Serialize analytics stats to indented JSON bytes"""
+        return orjson.dumps(stats, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+    
+    def stats_to_json(stats):
+        """Serialize analytics stats to indented JSON bytes"""
+        return json.dumps(stats, indent=2).encode()
+
+# Threads for parsing memory files
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def parse_one(category, memory_file):
+    """Parse a memory file into its (category, type, priority, agent) counters"""
+    with open(memory_file, 'rb') as f:
+        memory = _json_loads(f.read())
+    return (
+        category,
+        memory.get("type", "unknown"),
+        memory.get("content", {}).get("priority", "unknown"),
+        # Extract agent from metadata
+        memory.get("metadata", {}).get("agent", "unknown"),
+    )
 
 def analyze_memory_usage():
     """Analyze memory usage by category and agent"""
-    stats = {
-        "total_memories": 0,
-        "by_category": defaultdict(int),
-        "by_type": defaultdict(int),
-        "by_agent": defaultdict(int),
-        "by_priority": defaultdict(int)
-    }
-    
     memory_dir = Path("memory")
     
-    for category_dir in memory_dir.iterdir():
-        if category_dir.is_file():
-            continue
-            
-        category = category_dir.name
-        for memory_file in category_dir.glob("*.json"):
-            with open(memory_file) as f:
-                memory = json.load(f)
-            
-            stats["total_memories"] += 1
-            stats["by_category"][category] += 1
-            stats["by_type"][memory.get("type", "unknown")] += 1
-            stats["by_priority"][memory.get("content", {}).get("priority", "unknown")] += 1
+    # Collect every file first so parsing can fan out across threads;
+    # DirEntry caches the file type from readdir, so no per-entry stat
+    memory_files = []
+    with os.scandir(memory_dir) as categories:
+        for category_entry in categories:
+            if not category_entry.is_dir(follow_symlinks=False):
+                continue
             
-            # Extract agent from metadata
-            agent = memory.get("metadata", {}).get("agent", "unknown")
-            stats["by_agent"][agent] += 1
+            with os.scandir(category_entry.path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        memory_files.append((category_entry.name, entry.path))
     
-    return stats
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        records = list(executor.map(lambda item: parse_one(*item), memory_files))
+    
+    # Transpose the per-file tuples so each column is counted by Counter in C;
+    # results are plain dicts so they serialize without per-key dispatch
+    categories, types, priorities, agents = zip(*records) if records else ((), (), (), ())
+    return {
+        "total_memories": len(records),
+        "by_category": dict(Counter(categories)),
+        "by_type": dict(Counter(types)),
+        "by_agent": dict(Counter(agents)),
+        "by_priority": dict(Counter(priorities))
+    }
 
 def print_analytics(stats):
     """Print memory analytics"""
@@ -66,6 +96,11 @@ def print_analytics(stats):
         print(f"  {agent}: {count}")
 
 if __name__ == "__main__":
+    # --json writes the raw stats as one JSON document for reports and tooling
+    if "--json" in sys.argv[1:]:
+        sys.stdout.buffer.write(stats_to_json(analyze_memory_usage()) + b"\n")
+        sys.exit(0)
+    
     print("📊 Analyzing LCT Memory System...")
     stats = analyze_memory_usage()
     print_analytics(stats)
@@ -7,31 +7,169 @@ Automatically integrates memory system with Claude conversations
 import os
 import sys
 import json
+import copy
+import hashlib
+import importlib.util
+import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 
 # Add the scripts directory to Python path for imports
 scripts_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, scripts_dir)
 
 try:
-    from mem0ai_integration import LCTMem0aiAgentIntegration
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
+    ORJSON_AVAILABLE = False
+
+# The integration imports mem0, so only confirm it exists here; the import
+# itself happens when an agent is created
+if importlib.util.find_spec("mem0ai_integration") is None:
     print("❌ Memory integration not available. Run: python3 scripts/agent-memory-setup.py")
     print("Available files:", os.listdir('scripts/'))
     sys.exit(1)
 
+# Read cache for mem0ai lookups: most recent entries kept, each for at most TTL seconds
+CONTEXT_CACHE_SIZE = 256
+CONTEXT_CACHE_TTL = 300
+
+# Idle agents kept per agent name; extra released agents are dropped
+AGENT_POOL_SIZE = 8
+
+# Query normalisation so rephrasings of the same words share a cache entry
+# ("Rules for the invoices" / "invoice rules" -> "invoice rule"). Only case,
+# stop words, word order and plurals are folded - stemming further would
+# let unrelated queries ("state" / "station") share cached results.
+# Signed/decimal numbers, words in any script and comparison operators
+# ("amount > 1000" and "amount < -1000" must not share a key)
+_WORD_RE = re.compile(r"-?\d+(?:\.\d+)?|\w+|[<>]=?|[!=]=")
+_OPERATORS = frozenset({"<", ">", "<=", ">=", "!=", "=="})
+_STOP_WORDS = frozenset({"a", "an", "the", "for", "of", "to", "in", "on", "and", "with", "about", "is", "are"})
+
+def _singular(word: str) -> str:
+    """Strip an English plural ending from a word"""
+    if len(word) <= 3:
+        return word
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith(("sses", "ches", "shes", "xes", "zes")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+def normalize_query(query: str) -> str:
+    """Reduce a query to its sorted set of singular content words (in order if it compares)"""
+    words = [_singular(word) for word in _WORD_RE.findall(query.lower()) if word not in _STOP_WORDS]
+    
+    # Word order carries meaning around an operator ("a > b" is not "b > a")
+    if _OPERATORS.isdisjoint(words):
+        key = " ".join(sorted(set(words)))
+    else:
+        key = " ".join(words)
+    
+    # Nothing left to fold (e.g. only stop words or punctuation): key on the query itself
+    return key or query.strip().lower()
+
 class MemoryAwareAgent:
     """
     Memory-aware agent that automatically stores and retrieves memories
     during Claude conversations
     """
     
+    # Fixed attribute set keeps per-agent instances small
+    __slots__ = ("agent_name", "memory", "session_id", "_session_ctx", "_cache")
+    
+    # Idle agents by name, handed out by acquire() and returned by release();
+    # _pooled holds their ids so an agent can't be pooled twice
+    _pool: Dict[str, List["MemoryAwareAgent"]] = {}
+    _pooled: Set[int] = set()
+    _pool_lock = threading.Lock()
+    
+    @classmethod
+    def acquire(cls, agent_name: str = "primary_developer") -> "MemoryAwareAgent":
+        """
+        Get an agent from the pool, creating one only if none is idle
+        """
+        with cls._pool_lock:
+            idle = cls._pool.get(agent_name)
+            agent = idle.pop() if idle else None
+            if agent is not None:
+                cls._pooled.discard(id(agent))
+        
+        if agent is None:
+            return cls(agent_name)
+        agent._reset()
+        return agent
+    
+    @classmethod
+    def release(cls, agent: "MemoryAwareAgent"):
+        """
+        Return an agent to the pool for reuse by a later acquire()
+        """
+        with cls._pool_lock:
+            if id(agent) in cls._pooled:
+                raise ValueError(f"agent {agent.agent_name} ({agent.session_id}) was already released")
+            idle = cls._pool.setdefault(agent.agent_name, [])
+            if len(idle) < AGENT_POOL_SIZE:
+                idle.append(agent)
+                cls._pooled.add(id(agent))
+    
     def __init__(self, agent_name: str = "primary_developer"):
         self.agent_name = agent_name
+        from mem0ai_integration import LCTMem0aiAgentIntegration
         self.memory = LCTMem0aiAgentIntegration(agent_name)
+        
+        # (kind, key) -> (expires_at, generation, result); own writes clear it
+        # via invalidate(), writes by agents sharing the mem0ai system are
+        # caught by its generation counter
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._new_session()
+    
+    def _new_session(self):
+        """Assign a fresh session id and its context string"""
         self.session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
+        # Session context string is fixed for the session, so build it once
+        self._session_ctx = f"Session ID: {self.session_id}"
+    
+    def _reset(self):
+        """Prepare a pooled agent for a new user: flush writes, new session, empty cache"""
+        self.memory.flush()
+        self.invalidate()
+        self._new_session()
+    
+    def _cache_get(self, key: tuple):
+        """Return a cached result, or None if absent, expired or written since"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, generation, result = entry
+        if expires_at < time.monotonic() or generation != self.memory.mem0ai_system.generation:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return result
+    
+    def _cache_put(self, key: tuple, result):
+        """Cache a result, evicting the least recently used entry when full"""
+        self._cache[key] = (time.monotonic() + CONTEXT_CACHE_TTL,
+                            self.memory.mem0ai_system.generation, result)
+        self._cache.move_to_end(key)
+        if len(self._cache) > CONTEXT_CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    def invalidate(self):
+        """
+        Drop cached lookups so the next read sees newly stored memories
+        """
+        self._cache.clear()
+    
     def start_session(self, user_context: str = "") -> Dict[str, Any]:
         """
         Start a new session and retrieve relevant memories
@@ -45,6 +183,7 @@ class MemoryAwareAgent:
         )
         
         # Store session start
+        self.invalidate()
         session_memory = self.memory.store_decision(
             f"Started new session: {user_context}",
             f"User context: {user_context}",
@@ -64,6 +203,7 @@ class MemoryAwareAgent:
         """
         Automatically store implementation decisions
         """
+        self.invalidate()
         return self.memory.store_decision(
             decision=decision,
             context=context,
@@ -76,6 +216,7 @@ class MemoryAwareAgent:
         """
         Automatically store successful teaching approaches
         """
+        self.invalidate()
         return self.memory.store_learning(
             learning=approach,
             pattern=technique,
@@ -87,31 +228,51 @@ class MemoryAwareAgent:
         """
         Automatically store reusable code patterns
         """
+        self.invalidate()
         return self.memory.store_pattern(
             pattern_name=pattern_name,
             description=use_case,
             code_example=code_example
         )
     
-    def get_relevant_context(self, query: str, limit: int = 3) -> List[Dict]:
+    def get_relevant_context(self, query: str, limit: int = 3) -> Any:
         """
-        Get relevant memories for current work
+        Get relevant memories for current work, in the shape mem0ai's search returns
         """
-        return self.memory.get_relevant_memories(query, limit)
+        key = ("context", normalize_query(query), limit)
+        memories = self._cache_get(key)
+        if memories is None:
+            from mem0ai_integration import FailedSearch
+            memories = self.memory.get_relevant_memories(query, limit)
+            if isinstance(memories, FailedSearch):
+                return []
+            self._cache_put(key, memories)
+        
+        # Callers get their own copy so the cached result stays intact
+        return copy.deepcopy(memories)
     
     def chat_with_memory(self, message: str) -> str:
         """
         Chat with the memory system for AI-powered insights
         """
-        return self.memory.chat_with_memory(message)
+        # Messages can be long, so key on a fixed-size digest
+        key = ("chat", hashlib.blake2b(message.encode(), digest_size=16).digest())
+        response = self._cache_get(key)
+        if response is None:
+            from mem0ai_integration import FailedChat
+            response = self.memory.chat_with_memory(message)
+            if not isinstance(response, FailedChat):
+                self._cache_put(key, response)
+        return response
     
     def end_session(self, summary: str) -> str:
         """
         End session and store summary
         """
+        self.invalidate()
         return self.memory.store_decision(
             f"Session ended: {summary}",
-            f"Session ID: {self.session_id}",
+            self._session_ctx,
             "low"
         )
 
@@ -147,8 +308,12 @@ def create_memory_aware_claude_config():
     config_path = "memory/claude_memory_config.json"
     os.makedirs(os.path.dirname(config_path), exist_ok=True)
     
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(config_path, 'wb') as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(config_path, 'w') as f:
+            json.dump(config, f, indent=2)
     
     print(f"✅ Memory-aware Claude configuration saved to {config_path}")
     return config_path
@@ -161,7 +326,7 @@ def test_memory_aware_agent():
     
     try:
         # Initialize agent
-        agent = MemoryAwareAgent("primary_developer")
+        agent = MemoryAwareAgent.acquire("primary_developer")
         
         # Start session
         session = agent.start_session("Testing invoice validation feature")
@@ -196,6 +361,14 @@ def test_memory_aware_agent():
         context = agent.get_relevant_context("invoice validation", 2)
         print(f"✅ Retrieved {len(context)} relevant memories")
         
+        # Fresh and cached context keep the shape of mem0ai's search result
+        # (a {"results": [...]} dict in current mem0ai)
+        raw = agent.memory.get_relevant_memories("invoice validation", 2)
+        cached = agent.get_relevant_context("invoice validation", 2)
+        if type(context) is not type(raw) or cached != context:
+            raise AssertionError(f"context returned as {type(context).__name__}, search gave {type(raw).__name__}")
+        print("✅ Context keeps the search result shape")
+        
         # Chat with memory
         response = agent.chat_with_memory("What are the key patterns for invoice validation?")
         print(f"✅ Memory chat response: {response[:100]}...")
@@ -204,6 +377,8 @@ def test_memory_aware_agent():
         session_end = agent.end_session("Successfully tested memory integration")
         print(f"✅ Session ended: {session_end}")
         
+        MemoryAwareAgent.release(agent)
+        
         print("🎉 Memory-aware agent test completed successfully!")
         return True
         
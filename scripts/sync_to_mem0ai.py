@@ -4,8 +4,18 @@ Sync LCT Project Memory Files to mem0ai
 Run this script on your laptop where mem0ai is configured with API keys
 """
 
+import asyncio
+import hashlib
+import importlib.util
+import inspect
 import json
+import mmap
 import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 
@@ -17,57 +27,293 @@ except ImportError:
     print("⚠️ python-dotenv not installed. Install with: pip install python-dotenv")
 
 try:
-    from mem0 import Memory
-    MEM0AI_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    MEM0AI_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# mem0 itself is imported in _create_client
+MEM0AI_AVAILABLE = importlib.util.find_spec("mem0") is not None
+if not MEM0AI_AVAILABLE:
     print("❌ mem0ai not installed. Run: pip install mem0ai")
     exit(1)
 
+# Resolved once at import; every sync path is built from these
+project_root = Path(__file__).parent.parent
+
+# Files added by the structure update, synced by sync_new_memories_only
+NEW_MEMORY_FILES = tuple(project_root / "memory" / relative_path for relative_path in (
+    "project/project_structure_reorganization_001.json",
+    "development/development_structure_update_20251012.json",
+    "agents/primary_developer/structure_update_20251012.json",
+    "agents/sentinel/structure_update_20251012.json",
+    "agents/documentation_writer/structure_update_20251012.json",
+    "shared/project_structure_reference.json"
+))
+
+# Threads reading and formatting memory files; the adds themselves go
+# through the one mem0ai client serially
+SYNC_WORKERS = 16
+
+# With mem0's AsyncMemory client, at most this many adds are in flight at once
+ASYNC_CONCURRENCY = 32
+
+# Files at least this large are parsed straight from an mmap; below it the
+# extra mapping syscalls cost more than the copy they save
+MMAP_THRESHOLD = 16 * 1024
+
+# Status lines come from pool threads, so each is written whole under this lock
+_output_lock = threading.Lock()
+
+def _say(message: str):
+    """Print a whole line at once so concurrent syncs don't interleave"""
+    with _output_lock:
+        sys.stdout.write(message + "\n")
+        sys.stdout.flush()
+
+def _remote_id(result):
+    """Best-effort id of the memory mem0ai created, across its return shapes"""
+    if isinstance(result, dict):
+        result = result.get("results", result)
+    if isinstance(result, list) and result and isinstance(result[0], dict):
+        return result[0].get("id")
+    if isinstance(result, dict):
+        return result.get("id")
+    return None
+
+class SyncBatch:
+    """Collects prepared mem0ai adds and sends them together on flush"""
+
+    def __init__(self, memory, on_sent=None):
+        self.memory = memory
+        self.on_sent = on_sent
+        self.pending = []
+        self.failed = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, content: str, metadata: dict, key=None):
+        """Queue one memory for the next flush (safe to call from worker threads)
+
+        `key` is handed back to on_sent(key, result) once the push succeeds.
+        """
+        with self._lock:
+            self.pending.append((name, content, metadata, key))
+
+    def _sent(self, name: str, key, result) -> bool:
+        """Report a successful push"""
+        if self.on_sent is not None:
+            self.on_sent(key, result)
+        _say(f"✅ Synced: {name}")
+        return True
+
+    def _send(self, item) -> bool:
+        """Push one queued memory to mem0ai"""
+        name, content, metadata, key = item
+        try:
+            result = self.memory.add(content, metadata=metadata, user_id="lct_project")
+            return self._sent(name, key, result)
+        except Exception as e:
+            _say(f"❌ Failed to sync {name}: {e}")
+            return False
+
+    async def _send_async(self, item, semaphore) -> bool:
+        """Push one queued memory through an async mem0ai client"""
+        name, content, metadata, key = item
+        async with semaphore:
+            try:
+                result = await self.memory.add(content, metadata=metadata, user_id="lct_project")
+                return self._sent(name, key, result)
+            except Exception as e:
+                _say(f"❌ Failed to sync {name}: {e}")
+                return False
+
+    async def _send_all_async(self):
+        """Push every queued memory concurrently on one event loop"""
+        semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+        return await asyncio.gather(*(self._send_async(item, semaphore) for item in self.pending))
+
+    def flush(self):
+        """Send every queued memory
+
+        AsyncMemory overlaps the round-trips on one event loop. The threaded
+        Memory client is not documented as thread-safe (local Qdrant and the
+        SQLite history store), and local Qdrant allows only one client per
+        storage path, so its adds are sent one at a time.
+        """
+        if not self.pending:
+            return
+        if inspect.iscoroutinefunction(self.memory.add):
+            results = asyncio.run(self._send_all_async())
+        else:
+            results = [self._send(item) for item in self.pending]
+        self.failed.extend(item[0] for item, ok in zip(self.pending, results) if not ok)
+        self.pending = []
+
 class Mem0aiSync:
     """Sync local JSON memory files to mem0ai"""
 
-    def __init__(self):
-        self.project_root = Path(__file__).parent.parent
+    def __init__(self, force: bool = False, use_async: bool = False):
+        self.project_root = project_root
         self.memory_dir = self.project_root / "memory"
 
+        # Content digests of files already pushed, so reruns skip unchanged
+        # files; force=True pushes everything regardless
+        self.force = force
+        self.state_file = self.memory_dir / ".sync_state.json"
+        self._state = self._load_state()
+        self._state_lock = threading.Lock()
+
         # Initialize mem0ai with default config
         # Note: mem0ai will use API keys from environment or config
-        self.memory = Memory()
+        self.memory = self._create_client(use_async)
+
+        # Set while inside batch(); sync_memory_file queues adds on it
+        self._batch = None
+
+        # Formatted mem0ai text by file-content digest, so identical files
+        # are only formatted once per process
+        self._formatted = {}
+
+    def _create_client(self, use_async: bool):
+        """Create the mem0ai client, the async one if requested and available
+
+        Batches sent through AsyncMemory share one event loop instead of a
+        thread pool; older mem0ai releases without it use Memory.
+        """
+        if use_async:
+            try:
+                from mem0 import AsyncMemory
+                return AsyncMemory()
+            except ImportError:
+                print("⚠️ This mem0ai version has no AsyncMemory; using the threaded client")
+
+        # find_spec only saw the package; a broken install fails here
+        try:
+            from mem0 import Memory
+        except ImportError as e:
+            print(f"❌ mem0ai could not be imported ({e}). Run: pip install mem0ai")
+            sys.exit(1)
+        return Memory()
+
+    @contextmanager
+    def batch(self):
+        """Defer mem0ai adds made by sync_memory_file until the block exits
+
+        Files that fail to push are listed in the yielded batch's `failed`
+        once the block has exited.
+        """
+        self._batch = SyncBatch(self.memory, on_sent=self._record_sync)
+        try:
+            yield self._batch
+        finally:
+            batch, self._batch = self._batch, None
+            batch.flush()
+            self._save_state()
+
+    def _load_state(self) -> dict:
+        """Load the relative path -> {sha, remote_id} sync state"""
+        try:
+            return self.load_memory_file(self.state_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self):
+        """Persist the sync state, replacing the old file atomically"""
+        with self._state_lock:
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self._state, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            else:
+                data = json.dumps(self._state, indent=2, sort_keys=True).encode()
+        # Unique temp name per save, so concurrent runs never share one
+        fd, tmp_path = tempfile.mkstemp(prefix=".sync_state.", suffix=".tmp", dir=self.memory_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.state_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _record_sync(self, key: tuple, result):
+        """Remember that a file's current content has been pushed"""
+        relative_path, digest = key
+        with self._state_lock:
+            self._state[relative_path] = {"sha": digest, "remote_id": _remote_id(result)}
 
     def load_memory_file(self, file_path: Path) -> dict:
         """Load a JSON memory file"""
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        return self._load_with_digest(file_path)[1]
+
+    def _load_with_digest(self, file_path: Path) -> tuple:
+        """Load a JSON memory file as (blake2b digest of its bytes, data)"""
+        with open(file_path, 'rb') as f:
+            if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # The view must be released before the mapping closes
+                    view = memoryview(mm)
+                    try:
+                        return hashlib.blake2b(view, digest_size=16).hexdigest(), orjson.loads(view)
+                    finally:
+                        view.release()
+            data = f.read()
+
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if ORJSON_AVAILABLE:
+            return digest, orjson.loads(data)
+        return digest, json.loads(data)
 
     def format_content_for_mem0ai(self, memory_data: dict) -> str:
-        """Format memory data into text for mem0ai"""
-        content_parts = []
+        """Format memory data into text for mem0ai
+
+        The text is assembled in one bytearray so the serialized JSON is
+        appended as bytes, without intermediate strings or a join pass.
+        (JIT compilers such as Numba do not help with string building.)
+        """
+        content = memory_data['content']
+        buf = bytearray()
 
         # Add title if available
-        if 'content' in memory_data:
-            if 'title' in memory_data['content']:
-                content_parts.append(f"Title: {memory_data['content']['title']}")
-            if 'description' in memory_data['content']:
-                content_parts.append(f"Description: {memory_data['content']['description']}")
+        if 'title' in content:
+            buf += b"Title: "
+            buf += str(content['title']).encode()
+            buf += b"\n\n"
+        if 'description' in content:
+            buf += b"Description: "
+            buf += str(content['description']).encode()
+            buf += b"\n\n"
 
         # Add main content as JSON for structure
-        content_parts.append(f"Data: {json.dumps(memory_data['content'], indent=2)}")
+        buf += b"Data: "
+        if ORJSON_AVAILABLE:
+            buf += orjson.dumps(content, option=orjson.OPT_INDENT_2)
+        else:
+            buf += json.dumps(content, indent=2).encode()
 
-        return "\n\n".join(content_parts)
+        return buf.decode()
 
-    def sync_memory_file(self, file_path: Path, category: str) -> bool:
-        """Sync a single memory file to mem0ai"""
+    def sync_memory_file(self, file_path: Path, category: str):
+        """Sync a single memory file to mem0ai
+
+        Returns True when synced (or queued in a batch), False on failure and
+        None when the file is unchanged since its last sync.
+        """
         try:
-            memory_data = self.load_memory_file(file_path)
+            digest, memory_data = self._load_with_digest(file_path)
+            relative_path = str(file_path.relative_to(self.project_root))
+
+            if not self.force and self._state.get(relative_path, {}).get("sha") == digest:
+                _say(f"⏭  Unchanged: {file_path.name}")
+                return None
 
-            # Format content
-            content = self.format_content_for_mem0ai(memory_data)
+            # Format content, reusing the text for byte-identical files
+            content = self._formatted.get(digest)
+            if content is None:
+                content = self._formatted[digest] = self.format_content_for_mem0ai(memory_data)
 
             # Prepare metadata
             metadata = {
                 "category": category,
-                "file": str(file_path.relative_to(self.project_root)),
+                "file": relative_path,
                 "memory_id": memory_data.get('memory_id', file_path.stem),
                 "type": memory_data.get('type', 'unknown'),
                 "timestamp": memory_data.get('timestamp', datetime.now().isoformat()),
@@ -82,14 +328,23 @@ class Mem0aiSync:
             if 'content' in memory_data and 'tags' in memory_data['content']:
                 metadata['tags'] = ','.join(memory_data['content']['tags'])
 
+            # Inside batch() the push is deferred to the batch flush
+            if self._batch is not None:
+                self._batch.add(file_path.name, content, metadata, key=(relative_path, digest))
+                return True
+
             # Push to mem0ai
             result = self.memory.add(content, metadata=metadata, user_id="lct_project")
+            if inspect.isawaitable(result):
+                result = asyncio.run(result)
+            self._record_sync((relative_path, digest), result)
+            self._save_state()
 
-            print(f"✅ Synced: {file_path.name}")
+            _say(f"✅ Synced: {file_path.name}")
             return True
 
         except Exception as e:
-            print(f"❌ Failed to sync {file_path.name}: {e}")
+            _say(f"❌ Failed to sync {file_path.name}: {e}")
             return False
 
     def sync_all_memories(self):
@@ -98,44 +353,51 @@ class Mem0aiSync:
         print(f"📁 Memory directory: {self.memory_dir}")
         print()
 
-        synced = 0
-        failed = 0
-
-        # Sync by category
-        categories = {
-            'project': self.memory_dir / 'project',
-            'development': self.memory_dir / 'development',
-            'agents': self.memory_dir / 'agents',
-            'shared': self.memory_dir / 'shared'
-        }
-
-        for category, category_dir in categories.items():
-            if not category_dir.exists():
+        # Sync by category; agents/ holds one subdirectory per agent
+        categories = ('project', 'development', 'agents', 'shared')
+
+        # Flat (file, category) list so reads and parses can run in parallel.
+        # One os.walk enumerates everything, pruned to the category layout.
+        tasks = []
+        found = []
+        for root, dirs, files in os.walk(self.memory_dir):
+            parts = Path(root).relative_to(self.memory_dir).parts
+            if not parts:
+                # memory/ itself: only descend into the synced categories
+                dirs[:] = [category for category in categories if category in dirs]
                 continue
 
-            print(f"\n📂 Syncing {category}/ memories...")
-
-            # Find all JSON files
-            if category == 'agents':
-                # Agents have subdirectories
-                for agent_dir in category_dir.iterdir():
-                    if agent_dir.is_dir():
-                        for json_file in agent_dir.glob('*.json'):
-                            if self.sync_memory_file(json_file, f"{category}/{agent_dir.name}"):
-                                synced += 1
-                            else:
-                                failed += 1
-            else:
-                # Other categories are flat
-                for json_file in category_dir.glob('*.json'):
-                    if self.sync_memory_file(json_file, category):
-                        synced += 1
-                    else:
-                        failed += 1
+            if len(parts) == 1:
+                found.append(f"{parts[0]}/")
+                if parts[0] == 'agents':
+                    # Agents have subdirectories; only their contents are synced
+                    continue
+
+            # Other categories are flat, and agent directories are leaves
+            dirs[:] = []
+
+            category = '/'.join(parts)
+            for name in files:
+                if name.endswith('.json'):
+                    tasks.append((Path(root, name), category))
+
+        # Files from every category sync together, so announce them all up front
+        print(f"📂 Syncing {', '.join(found)} memories...")
+        with self.batch() as batch:
+            with ThreadPoolExecutor(max_workers=min(SYNC_WORKERS, len(tasks) or 1)) as executor:
+                results = list(executor.map(lambda task: self.sync_memory_file(*task), tasks))
+        synced = results.count(True)
+        failed = results.count(False)
+        skipped = results.count(None)
+
+        # Pushes happen when the batch flushes, so count their failures now
+        synced -= len(batch.failed)
+        failed += len(batch.failed)
 
         print()
         print("=" * 50)
         print(f"✅ Synced: {synced} memories")
+        print(f"⏭  Unchanged: {skipped} memories")
         print(f"❌ Failed: {failed} memories")
         print("=" * 50)
 
@@ -146,35 +408,35 @@ class Mem0aiSync:
         print("🔄 Syncing NEW memory files (structure update)...")
         print()
 
-        new_files = [
-            self.memory_dir / "project/project_structure_reorganization_001.json",
-            self.memory_dir / "development/development_structure_update_20251012.json",
-            self.memory_dir / "agents/primary_developer/structure_update_20251012.json",
-            self.memory_dir / "agents/sentinel/structure_update_20251012.json",
-            self.memory_dir / "agents/documentation_writer/structure_update_20251012.json",
-            self.memory_dir / "shared/project_structure_reference.json"
-        ]
-
         synced = 0
         failed = 0
-
-        for file_path in new_files:
-            if file_path.exists():
-                category = file_path.parent.parent.name
-                if 'agents' in str(file_path):
-                    category = f"agents/{file_path.parent.name}"
-
-                if self.sync_memory_file(file_path, category):
-                    synced += 1
+        skipped = 0
+
+        with self.batch() as batch:
+            for file_path in NEW_MEMORY_FILES:
+                if file_path.exists():
+                    category = file_path.parent.parent.name
+                    if 'agents' in str(file_path):
+                        category = f"agents/{file_path.parent.name}"
+
+                    result = self.sync_memory_file(file_path, category)
+                    if result is None:
+                        skipped += 1
+                    elif result:
+                        synced += 1
+                    else:
+                        failed += 1
                 else:
+                    print(f"⚠️  File not found: {file_path.name}")
                     failed += 1
-            else:
-                print(f"⚠️  File not found: {file_path.name}")
-                failed += 1
+
+        synced -= len(batch.failed)
+        failed += len(batch.failed)
 
         print()
         print("=" * 50)
         print(f"✅ Synced: {synced} new memories")
+        print(f"⏭  Unchanged: {skipped} memories")
         print(f"❌ Failed: {failed} memories")
         print("=" * 50)
 
@@ -192,7 +454,9 @@ def main():
         print("Install with: pip install mem0ai")
         return 1
 
-    sync = Mem0aiSync()
+    # --force re-pushes files even if they are unchanged since the last sync;
+    # --async sends batches through mem0's AsyncMemory client
+    sync = Mem0aiSync(force="--force" in sys.argv[1:], use_async="--async" in sys.argv[1:])
 
     # Ask user what to sync
     print("What would you like to sync?")
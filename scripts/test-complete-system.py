@@ -4,17 +4,98 @@ LCT Commit Complete System Test
 Tests the entire hybrid agent architecture with memory system
 """
 
+import atexit
 import os
 import sys
 import json
-import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+# Long-lived interpreter that runs project scripts on request, so each script
+# test costs a pipe round-trip instead of a fresh interpreter start. Requests
+# and replies are one JSON object per line. Scripts share the interpreter, so
+# after each one the project modules it imported are dropped from sys.modules;
+# the next script re-imports them with fresh state (LCTMemorySystem._shared,
+# parse caches), while stdlib and third-party imports stay warm.
+_SCRIPT_WORKER = r"""
+import contextlib, io, json, os, runpy, sys, traceback
+project_dir = os.getcwd() + os.sep
+for line in sys.stdin:
+    request = json.loads(line)
+    script = request["script"]
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    sys.argv = [script]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+    sys.path.pop(0)
+    for name, module in list(sys.modules.items()):
+        if os.path.abspath(getattr(module, "__file__", None) or "").startswith(project_dir):
+            del sys.modules[name]
+    reply = {"returncode": returncode, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+    sys.__stdout__.write(json.dumps(reply) + "\n")
+    sys.__stdout__.flush()
+"""
+
+# Files whose contents the tests inspect; each is read once into the manifest
+MANIFEST_FILES = (
+    "claude.md",
+    ".claude/agents/code-reviewer.md",
+    ".git/hooks/pre-commit",
+    "docs/TEAM_ONBOARDING.md"
+)
+
+class _ThreadOutput:
+    """sys.stdout stand-in that holds back each thread's writes while a test runs
+    
+    Parallel tests print their own detail lines; collecting them per thread
+    lets run_test print each test's output as one block.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def begin(self):
+        self._local.buffer = []
+    
+    def end(self):
+        buffer, self._local.buffer = self._local.buffer, None
+        return "".join(buffer)
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return self.stream.write(text)
+        buffer.append(text)
+        return len(text)
+    
+    def flush(self):
+        if getattr(self._local, "buffer", None) is None:
+            self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
 class LCTSystemTester:
     """Comprehensive testing for LCT Commit agent system"""
     
@@ -26,24 +107,108 @@ class LCTSystemTester:
             "warnings": 0,
             "tests": []
         }
+        self._results_lock = threading.Lock()
+        
+        # relative path -> bytes for every MANIFEST_FILES entry that exists;
+        # tests only do lookups, so concurrent tests can share it
+        self.manifest = self._load_manifest()
+        self._output_lock = threading.Lock()
+        
+        # Script worker, started on first use; closed by run_all_tests or,
+        # when tests are called individually, at interpreter exit
+        self._worker = None
+        self._worker_lock = threading.Lock()
+    
+    def _run_script(self, script):
+        """Run a project script in the shared worker interpreter"""
+        # Only the script tests need subprocess, so import it on first use
+        import subprocess
+        
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = subprocess.Popen(
+                    [sys.executable, "-u", "-c", _SCRIPT_WORKER],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                    text=True, cwd=self.project_root
+                )
+                atexit.register(self._close_worker)
+            self._worker.stdin.write(json.dumps({"script": script}) + "\n")
+            self._worker.stdin.flush()
+            reply = self._worker.stdout.readline()
+        
+        if not reply:
+            raise RuntimeError(f"script worker exited while running {script}")
+        reply = json.loads(reply)
+        return subprocess.CompletedProcess(script, reply["returncode"], reply["stdout"], reply["stderr"])
+    
+    def _close_worker(self):
+        """Stop the script worker if it was started"""
+        with self._worker_lock:
+            if self._worker is not None:
+                self._worker.stdin.close()
+                self._worker.wait()
+                self._worker = None
+    
+    def _load_manifest(self):
+        """Read each manifest file once; a missing file is simply left out"""
+        manifest = {}
+        for relative_path in MANIFEST_FILES:
+            try:
+                manifest[relative_path] = (self.project_root / relative_path).read_bytes()
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+        return manifest
+    
+    def _entry_names(self, relative_dir):
+        """Names in a project directory from one scandir (empty if it is missing)"""
+        try:
+            with os.scandir(self.project_root / relative_dir) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
     
     def run_test(self, test_name, test_func):
-        """Run a single test and record results"""
-        print(f"🧪 Testing: {test_name}")
+        """Run a single test and record results
+        
+        While stdout is a _ThreadOutput (the parallel group), the header, the
+        test's own output and the result are printed together as one block.
+        """
+        capture = sys.stdout if isinstance(sys.stdout, _ThreadOutput) else None
+        if capture is None:
+            self._say(f"🧪 Testing: {test_name}")
+        else:
+            capture.begin()
+        
         try:
             result = test_func()
             if result:
-                print(f"✅ PASSED: {test_name}")
-                self.test_results["passed"] += 1
-                self.test_results["tests"].append({"name": test_name, "status": "PASSED"})
+                message = f"✅ PASSED: {test_name}"
+                self._record("passed", {"name": test_name, "status": "PASSED"})
             else:
-                print(f"❌ FAILED: {test_name}")
-                self.test_results["failed"] += 1
-                self.test_results["tests"].append({"name": test_name, "status": "FAILED"})
+                message = f"❌ FAILED: {test_name}"
+                self._record("failed", {"name": test_name, "status": "FAILED"})
         except Exception as e:
-            print(f"⚠️ WARNING: {test_name} - {str(e)}")
-            self.test_results["warnings"] += 1
-            self.test_results["tests"].append({"name": test_name, "status": "WARNING", "error": str(e)})
+            message = f"⚠️ WARNING: {test_name} - {str(e)}"
+            self._record("warnings", {"name": test_name, "status": "WARNING", "error": str(e)})
+        finally:
+            output = capture.end() if capture is not None else ""
+        
+        if capture is None:
+            self._say(message)
+        else:
+            self._say(f"🧪 Testing: {test_name}\n{output}{message}")
+    
+    def _say(self, message):
+        """Print a whole line at once so concurrent tests don't interleave"""
+        with self._output_lock:
+            sys.stdout.write(message + "\n")
+            sys.stdout.flush()
+    
+    def _record(self, counter, entry):
+        """Record a test result; tests may finish concurrently"""
+        with self._results_lock:
+            self.test_results[counter] += 1
+            self.test_results["tests"].append(entry)
     
     def test_agent_documentation(self):
         """Test that all agent documentation exists"""
@@ -56,8 +221,10 @@ class LCTSystemTester:
             "docs/agents/memory-examples.md"
         ]
         
+        # Every required doc lives in docs/agents, so one listing covers them
+        existing = self._entry_names("docs/agents")
         for file_path in required_files:
-            if not (self.project_root / file_path).exists():
+            if os.path.basename(file_path) not in existing:
                 print(f"❌ Missing: {file_path}")
                 return False
         
@@ -69,14 +236,15 @@ class LCTSystemTester:
         if not memory_dir.exists():
             return False
         
+        existing = self._entry_names("memory")
         required_dirs = ["project", "development", "sessions", "shared", "agents"]
         for dir_name in required_dirs:
-            if not (memory_dir / dir_name).exists():
+            if dir_name not in existing:
                 print(f"❌ Missing memory directory: {dir_name}")
                 return False
         
         # Check for schema file
-        if not (memory_dir / "schema.json").exists():
+        if "schema.json" not in existing:
             print("❌ Missing memory schema")
             return False
         
@@ -136,16 +304,14 @@ class LCTSystemTester:
         ]
         
         for config_file in config_files:
-            file_path = self.project_root / config_file
-            if not file_path.exists():
+            content = self.manifest.get(config_file)
+            if content is None:
                 print(f"❌ Missing config: {config_file}")
                 return False
             
             # Check if file references agent docs
-            with open(file_path, 'r') as f:
-                content = f.read()
-                if "docs/agents/" not in content:
-                    print(f"⚠️ Config {config_file} may not reference agent docs")
+            if b"docs/agents/" not in content:
+                print(f"⚠️ Config {config_file} may not reference agent docs")
         
         return True
     
@@ -160,31 +326,36 @@ class LCTSystemTester:
             "scripts/memory_analytics.py"
         ]
         
+        # One scandir covers both the presence and the permission checks
+        try:
+            with os.scandir(self.project_root / "scripts") as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            entries = {}
+        
         for script in scripts:
-            script_path = self.project_root / script
-            if not script_path.exists():
+            entry = entries.get(os.path.basename(script))
+            if entry is None:
                 print(f"❌ Missing script: {script}")
                 return False
             
             # Check if script is executable (for .sh files)
             if script.endswith('.sh'):
-                if not os.access(script_path, os.X_OK):
+                if not entry.stat().st_mode & 0o111:
                     print(f"⚠️ Script not executable: {script}")
         
         return True
     
     def test_pre_commit_hook(self):
         """Test pre-commit hook installation"""
-        hook_file = self.project_root / ".git/hooks/pre-commit"
-        if not hook_file.exists():
+        content = self.manifest.get(".git/hooks/pre-commit")
+        if content is None:
             print("❌ Pre-commit hook not installed")
             return False
         
         # Check if hook references Sentinel
-        with open(hook_file, 'r') as f:
-            content = f.read()
-            if "Sentinel" not in content:
-                print("⚠️ Pre-commit hook may not reference Sentinel")
+        if b"Sentinel" not in content:
+            print("⚠️ Pre-commit hook may not reference Sentinel")
         
         return True
     
@@ -192,9 +363,7 @@ class LCTSystemTester:
         """Test memory analytics functionality"""
         try:
             # Run memory analytics
-            result = subprocess.run([
-                sys.executable, "scripts/memory_analytics.py"
-            ], capture_output=True, text=True, cwd=self.project_root)
+            result = self._run_script("scripts/memory_analytics.py")
             
             if result.returncode != 0:
                 print(f"❌ Memory analytics failed: {result.stderr}")
@@ -215,9 +384,7 @@ class LCTSystemTester:
         """Test memory cleanup functionality"""
         try:
             # Run memory cleanup
-            result = subprocess.run([
-                sys.executable, "scripts/cleanup_memories.py"
-            ], capture_output=True, text=True, cwd=self.project_root)
+            result = self._run_script("scripts/cleanup_memories.py")
             
             if result.returncode != 0:
                 print(f"❌ Memory cleanup failed: {result.stderr}")
@@ -267,7 +434,8 @@ class LCTSystemTester:
     
     def test_initial_memories(self):
         """Test that initial memories were created"""
-        project_memories = list((self.project_root / "memory/project").glob("*.json"))
+        project_dir = self.project_root / "memory/project"
+        project_memories = [name for name in self._entry_names("memory/project") if name.endswith(".json")]
         if len(project_memories) == 0:
             print("❌ No initial project memories found")
             return False
@@ -280,14 +448,18 @@ class LCTSystemTester:
             "development_teaching_approach_001"
         ]
         
-        found_memories = []
-        for memory_file in project_memories:
-            with open(memory_file) as f:
-                memory = json.load(f)
-                found_memories.append(memory["memory_id"])
+        # Memory files are named after their memory_id, so the file stem
+        # usually answers this; only parse the files if something is missing
+        missing = set(expected_memories) - {name[:-5] for name in project_memories}
+        if missing:
+            found_memories = {
+                _json_loads((project_dir / name).read_bytes())["memory_id"]
+                for name in project_memories
+            }
+            missing -= found_memories
         
         for expected in expected_memories:
-            if expected not in found_memories:
+            if expected in missing:
                 print(f"❌ Missing initial memory: {expected}")
                 return False
         
@@ -295,26 +467,24 @@ class LCTSystemTester:
     
     def test_team_onboarding_docs(self):
         """Test team onboarding documentation"""
-        onboarding_file = self.project_root / "docs/TEAM_ONBOARDING.md"
-        if not onboarding_file.exists():
+        content = self.manifest.get("docs/TEAM_ONBOARDING.md")
+        if content is None:
             print("❌ Team onboarding guide not found")
             return False
         
         # Check for key sections
-        with open(onboarding_file, 'r') as f:
-            content = f.read()
-            required_sections = [
-                "Quick Start",
-                "Agent System Overview", 
-                "Configuration Files",
-                "Environment Variables",
-                "Troubleshooting"
-            ]
-            
-            for section in required_sections:
-                if section not in content:
-                    print(f"❌ Missing onboarding section: {section}")
-                    return False
+        required_sections = [
+            "Quick Start",
+            "Agent System Overview", 
+            "Configuration Files",
+            "Environment Variables",
+            "Troubleshooting"
+        ]
+        
+        for section in required_sections:
+            if section.encode() not in content:
+                print(f"❌ Missing onboarding section: {section}")
+                return False
         
         return True
     
@@ -323,22 +493,43 @@ class LCTSystemTester:
         print("🧪 LCT Commit Complete System Test")
         print("=" * 50)
         
-        # Core system tests
-        self.run_test("Agent Documentation", self.test_agent_documentation)
-        self.run_test("Memory System Structure", self.test_memory_system_structure)
-        self.run_test("Memory System Functionality", self.test_memory_system_functionality)
-        self.run_test("Agent Configurations", self.test_agent_configurations)
-        self.run_test("Setup Scripts", self.test_setup_scripts)
-        self.run_test("Pre-commit Hook", self.test_pre_commit_hook)
-        
-        # Memory system tests
-        self.run_test("Memory Analytics", self.test_memory_analytics)
-        self.run_test("Memory Cleanup", self.test_memory_cleanup)
-        self.run_test("Agent Memory Integration", self.test_agent_memory_integration)
-        self.run_test("Initial Memories", self.test_initial_memories)
-        
-        # Documentation tests
-        self.run_test("Team Onboarding Docs", self.test_team_onboarding_docs)
+        # Read-only checks (and the analytics subprocess) overlap; nothing
+        # writes memory files while they run
+        parallel_tests = [
+            ("Agent Documentation", self.test_agent_documentation),
+            ("Memory System Structure", self.test_memory_system_structure),
+            ("Agent Configurations", self.test_agent_configurations),
+            ("Setup Scripts", self.test_setup_scripts),
+            ("Pre-commit Hook", self.test_pre_commit_hook),
+            ("Memory Analytics", self.test_memory_analytics),
+            ("Initial Memories", self.test_initial_memories),
+            ("Team Onboarding Docs", self.test_team_onboarding_docs)
+        ]
+        
+        # These add or delete memories (cleanup could remove the low-priority
+        # test memory mid-test), so they run one at a time afterwards
+        serial_tests = [
+            ("Memory System Functionality", self.test_memory_system_functionality),
+            ("Memory Cleanup", self.test_memory_cleanup),
+            ("Agent Memory Integration", self.test_agent_memory_integration)
+        ]
+        
+        try:
+            sys.stdout = _ThreadOutput(sys.stdout)
+            try:
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    list(executor.map(lambda test: self.run_test(*test), parallel_tests))
+            finally:
+                sys.stdout = sys.stdout.stream
+            
+            for test_name, test_func in serial_tests:
+                self.run_test(test_name, test_func)
+        finally:
+            self._close_worker()
+        
+        # Report in the declared order rather than completion order
+        order = {name: index for index, (name, _) in enumerate(parallel_tests + serial_tests)}
+        self.test_results["tests"].sort(key=lambda test: order[test["name"]])
         
         # Print results
         self.print_results()
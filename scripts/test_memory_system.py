@@ -2,40 +2,74 @@
 """
 Test the LCT Memory System
 """
+import os
 import sys
-import json
-from pathlib import Path
 
-def test_memory_structure():
+MEMORY_DIR = "memory"
+
+# (name, path) for each directory test_memory_structure requires
+REQUIRED_DIRS = tuple(
+    (name, os.path.join(MEMORY_DIR, name))
+    for name in ("project", "development", "sessions", "shared", "agents")
+)
+FOUND_DIR_PREFIX = "✅ Found directory: "
+MISSING_DIR_PREFIX = "❌ Missing directory: "
+
+def _scan_memory():
+    """Walk memory/ once for both tests
+    
+    Returns the names of the directories directly under memory/ and the
+    number of *.json files in memory/project.
+    """
+    found_dirs = set()
+    project_json_count = 0
+    try:
+        # is_dir(follow_symlinks=False) uses the cached d_type, so no extra stat
+        with os.scandir(MEMORY_DIR) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                found_dirs.add(entry.name)
+                if entry.name == "project":
+                    # Only names are needed here, so plain listdir strings will do
+                    project_json_count = sum(1 for name in os.listdir(entry.path) if name.endswith(".json"))
+    except FileNotFoundError:
+        pass
+    return found_dirs, project_json_count
+
+def test_memory_structure(found_dirs=None):
     """Test that memory structure exists"""
-    memory_dir = Path("memory")
+    if found_dirs is None:
+        found_dirs, _ = _scan_memory()
     
-    required_dirs = ["project", "development", "sessions", "shared", "agents"]
-    for dir_name in required_dirs:
-        dir_path = memory_dir / dir_name
-        if not dir_path.exists():
-            print(f"❌ Missing directory: {dir_path}")
-            return False
-        print(f"✅ Found directory: {dir_path}")
+    missing = {name for name, _ in REQUIRED_DIRS} - found_dirs
     
-    return True
+    # Report lines are written in one go rather than a print per directory
+    if missing:
+        lines = [MISSING_DIR_PREFIX + path for name, path in REQUIRED_DIRS if name in missing]
+    else:
+        lines = [FOUND_DIR_PREFIX + path for _, path in REQUIRED_DIRS]
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    return not missing
 
-def test_initial_memories():
+def test_initial_memories(project_json_count=None):
     """Test that initial memories exist"""
-    project_dir = Path("memory/project")
-    memory_files = list(project_dir.glob("*.json"))
+    if project_json_count is None:
+        _, project_json_count = _scan_memory()
     
-    if len(memory_files) == 0:
+    if project_json_count == 0:
         print("❌ No initial memories found")
         return False
     
-    print(f"✅ Found {len(memory_files)} initial memories")
+    print(f"✅ Found {project_json_count} initial memories")
     return True
 
 if __name__ == "__main__":
     print("🧠 Testing LCT Memory System...")
     
-    if test_memory_structure() and test_initial_memories():
+    found_dirs, project_json_count = _scan_memory()
+    if test_memory_structure(found_dirs) and test_initial_memories(project_json_count):
         print("✅ Memory system test passed")
         sys.exit(0)
     else: